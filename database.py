@@ -6,6 +6,7 @@ for use with SQLAdmin admin interface.
 """
 
 import os
+import json
 from datetime import datetime
 from typing import Optional, List
 from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, JSON, Boolean, Date, ForeignKey, TIMESTAMP
@@ -38,6 +39,12 @@ engine = create_engine(DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+def load_verses_json(value):
+    """Decode a verses_json value, which older rows store as a JSON string"""
+    if isinstance(value, (str, bytes, bytearray)):
+        return json.loads(value)
+    return value
+
 # Models based on existing database structure
 
 class CanonicalMele(Base):
@@ -8,6 +8,7 @@ import sys
 import glob
 import json
 from pathlib import Path
+from typing import List, Optional, Tuple
 
 # Add parent directory to path so we can import scripts modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -24,9 +25,6 @@ class BatchProcessor:
     def find_or_create_canonical_mele(self, parsed_song) -> str:
         """Find existing or create new canonical_mele record"""
         # This is a simplified version - you might want more sophisticated matching
-        if not self.db_validator.conn:
-            self.db_validator.connect()
-        
         try:
             with self.db_validator.conn.cursor() as cursor:
                 # Generate the canonical ID from title
@@ -73,8 +71,14 @@ class BatchProcessor:
             self.db_validator.logger.error(f"Failed to find/create canonical_mele: {e}")
             raise
     
-    def process_file(self, file_path: str) -> bool:
-        """Process a single HTML file"""
+    def process_file(self, file_path: str) -> List[Tuple[str, Optional[str]]]:
+        """Process a single HTML file
+        
+        Validation rows are queued and written in batches, so a file only
+        counts as stored once a flush reports it. Returns (source_file, error)
+        for each song a flush triggered here wrote, or [(file_path, error)]
+        if the file could not be parsed or queued.
+        """
         try:
             self.db_validator.logger.info(f"Processing: {file_path}")
             
@@ -88,18 +92,30 @@ class BatchProcessor:
             validation_data = self.parser._prepare_validation_data(parsed_song)
             validation_data['source_file'] = file_path
             
-            # Store validation results
-            self.db_validator.validate_and_store_song(validation_data, canonical_mele_id)
-            
-            self.db_validator.logger.info(f"Successfully processed: {file_path}")
-            return True
+            # Queue validation results
+            validation_result = self.db_validator.validate_song(validation_data)
+            return self.db_validator.store_validation_result(
+                validation_result, canonical_mele_id, validation_data
+            )
             
         except Exception as e:
             self.db_validator.logger.error(f"Failed to process {file_path}: {e}")
-            return False
+            return [(file_path, str(e))]
+    
+    def _record_outcomes(self, results: dict, outcomes: List[Tuple[str, Optional[str]]]):
+        """Count each song a flush (or a failed parse) reported"""
+        for source_file, error in outcomes:
+            if error is None:
+                results['successful'] += 1
+                self.db_validator.logger.info(f"Successfully processed: {source_file}")
+            else:
+                results['failed'] += 1
+                results['failed_files'].append(source_file)
     
     def process_directory(self, directory: str, pattern: str = "*.txt") -> dict:
         """Process all files in a directory matching the pattern"""
+        if not self.db_validator.conn:
+            self.db_validator.connect()
         
         # Start validation session
         session_name = f"batch_process_{Path(directory).name}_{self._timestamp()}"
@@ -122,11 +138,10 @@ class BatchProcessor:
         }
         
         for file_path in files:
-            if self.process_file(file_path):
-                results['successful'] += 1
-            else:
-                results['failed'] += 1
-                results['failed_files'].append(file_path)
+            self._record_outcomes(results, self.process_file(file_path))
+        
+        # Write whatever is still queued before closing the session
+        self._record_outcomes(results, self.db_validator.flush_pending())
         
         # Complete the session
         self.db_validator.complete_validation_session()
@@ -34,41 +34,45 @@ def clear_song_data():
     
     try:
         conn = psycopg2.connect(database_url)
-        cur = conn.cursor()
-        
-        print("🗑️  Clearing song data from database...")
-        
-        # Get list of tables first
-        cur.execute("""
-            SELECT tablename FROM pg_tables 
-            WHERE schemaname = 'public' 
-            AND tablename LIKE '%mele%' OR tablename LIKE '%song%'
-            ORDER BY tablename
-        """)
-        tables = cur.fetchall()
-        
-        if tables:
-            print(f"📋 Found {len(tables)} song-related tables:")
-            for table in tables:
-                print(f"   - {table[0]}")
-        
-        # Clear the main song tables (based on what we found)
-        tables_to_clear = [
-            'mele_sources',      # Clear first due to foreign key constraints
-            'canonical_mele',    # Then clear the main table
-            'mele_media',        # And media links
-        ]
-        
-        for table in tables_to_clear:
-            try:
-                cur.execute(f"DELETE FROM {table}")
-                deleted = cur.rowcount
-                print(f"   ✅ Cleared {table}: {deleted} rows deleted")
-            except psycopg2.Error as e:
-                print(f"   ⚠️  Could not clear {table}: {e}")
-        
-        conn.commit()
-        conn.close()
+        try:
+            # The connection context commits on success and rolls back on error
+            with conn, conn.cursor() as cur:
+                print("🗑️  Clearing song data from database...")
+                
+                # Get list of tables first
+                cur.execute("""
+                    SELECT tablename FROM pg_tables 
+                    WHERE schemaname = 'public' 
+                    AND tablename LIKE '%mele%' OR tablename LIKE '%song%'
+                    ORDER BY tablename
+                """)
+                tables = cur.fetchall()
+                
+                if tables:
+                    print(f"📋 Found {len(tables)} song-related tables:")
+                    for table in tables:
+                        print(f"   - {table[0]}")
+                
+                # Clear the main song tables (based on what we found)
+                tables_to_clear = [
+                    'mele_sources',      # Clear first due to foreign key constraints
+                    'canonical_mele',    # Then clear the main table
+                    'mele_media',        # And media links
+                ]
+                
+                for table in tables_to_clear:
+                    # A savepoint per table lets the others still clear if one fails
+                    cur.execute("SAVEPOINT clear_table")
+                    try:
+                        cur.execute(f"DELETE FROM {table}")
+                        deleted = cur.rowcount
+                        cur.execute("RELEASE SAVEPOINT clear_table")
+                        print(f"   ✅ Cleared {table}: {deleted} rows deleted")
+                    except psycopg2.Error as e:
+                        cur.execute("ROLLBACK TO SAVEPOINT clear_table")
+                        print(f"   ⚠️  Could not clear {table}: {e}")
+        finally:
+            conn.close()
         
         print("✅ Database cleared successfully!")
         return True
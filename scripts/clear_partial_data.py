@@ -2,18 +2,14 @@
 """Clear partial migration data"""
 
 import os
-from sqlalchemy import create_engine
-from database import get_database_url, Verses, VerseLines, VerseProcessingMetadata
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, text
+from database import get_database_url
 
 engine = create_engine(get_database_url())
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-session = SessionLocal()
 
-# Clear any partial data
-session.query(VerseLines).delete()
-session.query(Verses).delete() 
-session.query(VerseProcessingMetadata).delete()
-session.commit()
-session.close()
-print('Cleared partial migration data')
\ No newline at end of file
+# Clear any partial data in one transaction; TRUNCATE avoids per-row WAL
+with engine.begin() as conn:
+    conn.execute(text(
+        "TRUNCATE TABLE verse_lines, verses, verse_processing_metadata RESTART IDENTITY"
+    ))
+print('Cleared partial migration data')
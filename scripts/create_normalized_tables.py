@@ -8,11 +8,70 @@ replacing the verses_json column approach with proper relational tables.
 
 import os
 import sys
+import time
 from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
 from database import Base, get_database_url
 
-def create_tables():
-    """Create the new normalized verse tables"""
+# Fail fast instead of queueing behind other sessions for the DDL locks
+DDL_LOCK_TIMEOUT = '5s'
+DDL_STATEMENT_TIMEOUT = '30s'
+DDL_MAX_ATTEMPTS = 4
+
+def _apply_ddl(conn, unlogged):
+    """Create the tables and unique constraints on an open transaction"""
+    conn.execute(text(f"SET LOCAL lock_timeout = '{DDL_LOCK_TIMEOUT}'"))
+    conn.execute(text(f"SET LOCAL statement_timeout = '{DDL_STATEMENT_TIMEOUT}'"))
+    
+    # Create the new tables in a single dependency-ordered pass
+    tables_to_create = [
+        Base.metadata.tables[name]
+        for name in ('verses', 'verse_lines', 'verse_processing_metadata')
+    ]
+    Base.metadata.create_all(bind=conn, tables=tables_to_create, checkfirst=True)
+    
+    # Unique constraints for verses table
+    conn.execute(text("""
+        ALTER TABLE verses 
+        ADD CONSTRAINT unique_mele_verse_id 
+        UNIQUE (mele_source_id, verse_id)
+    """))
+    
+    conn.execute(text("""
+        ALTER TABLE verses 
+        ADD CONSTRAINT unique_mele_verse_order 
+        UNIQUE (mele_source_id, verse_order)
+    """))
+    
+    # Unique constraints for verse_lines table
+    conn.execute(text("""
+        ALTER TABLE verse_lines 
+        ADD CONSTRAINT unique_verse_line_id 
+        UNIQUE (verse_id, line_id)
+    """))
+    
+    conn.execute(text("""
+        ALTER TABLE verse_lines 
+        ADD CONSTRAINT unique_verse_line_number 
+        UNIQUE (verse_id, line_number)
+    """))
+    
+    if unlogged:
+        # verse_lines references verses, so it has to go first
+        for table in ('verse_lines', 'verses', 'verse_processing_metadata'):
+            conn.execute(text(f"ALTER TABLE {table} SET UNLOGGED"))
+
+def create_tables(unlogged=False):
+    """Create the new normalized verse tables
+    
+    With unlogged=True the tables are switched to UNLOGGED so the initial
+    bulk migration skips WAL. They must be switched back before production
+    traffic, referenced table first:
+    
+        ALTER TABLE verses SET LOGGED;
+        ALTER TABLE verse_lines SET LOGGED;
+        ALTER TABLE verse_processing_metadata SET LOGGED;
+    """
     
     # Get database connection
     DATABASE_URL = get_database_url()
@@ -21,49 +80,27 @@ def create_tables():
     print("Creating normalized verse tables...")
     
     try:
-        # Create the new tables
-        Base.metadata.create_all(engine, tables=[
-            Base.metadata.tables['verses'],
-            Base.metadata.tables['verse_lines'], 
-            Base.metadata.tables['verse_processing_metadata']
-        ])
+        for attempt in range(DDL_MAX_ATTEMPTS):
+            try:
+                # Create tables and constraints in one DDL transaction
+                with engine.begin() as conn:
+                    _apply_ddl(conn, unlogged)
+                break
+            except OperationalError as e:
+                # Lock or statement timeout: back off and retry
+                if attempt == DDL_MAX_ATTEMPTS - 1:
+                    raise
+                delay = 2 ** attempt
+                print(f"⚠️  DDL timed out ({e.orig}), retrying in {delay}s...")
+                time.sleep(delay)
         
         print("✅ Successfully created tables:")
         print("  - verses")
         print("  - verse_lines")
         print("  - verse_processing_metadata")
-        
-        # Add unique constraints
-        with engine.connect() as conn:
-            # Unique constraints for verses table
-            conn.execute(text("""
-                ALTER TABLE verses 
-                ADD CONSTRAINT unique_mele_verse_id 
-                UNIQUE (mele_source_id, verse_id)
-            """))
-            
-            conn.execute(text("""
-                ALTER TABLE verses 
-                ADD CONSTRAINT unique_mele_verse_order 
-                UNIQUE (mele_source_id, verse_order)
-            """))
-            
-            # Unique constraints for verse_lines table
-            conn.execute(text("""
-                ALTER TABLE verse_lines 
-                ADD CONSTRAINT unique_verse_line_id 
-                UNIQUE (verse_id, line_id)
-            """))
-            
-            conn.execute(text("""
-                ALTER TABLE verse_lines 
-                ADD CONSTRAINT unique_verse_line_number 
-                UNIQUE (verse_id, line_number)
-            """))
-            
-            conn.commit()
-            
         print("✅ Successfully added unique constraints")
+        if unlogged:
+            print("⚠️  Tables set UNLOGGED - run ALTER TABLE ... SET LOGGED after migration")
         
     except Exception as e:
         print(f"❌ Error creating tables: {e}")
@@ -84,15 +121,20 @@ def verify_tables():
             # Check that tables exist
             tables = ['verses', 'verse_lines', 'verse_processing_metadata']
             
+            # One bound query for all tables instead of one literal query each
+            result = conn.execute(text("""
+                SELECT table_name, column_name, data_type, is_nullable
+                FROM information_schema.columns 
+                WHERE table_name = ANY(:tables)
+                ORDER BY table_name, ordinal_position
+            """), {"tables": tables})
+            
+            columns_by_table = {table: [] for table in tables}
+            for col in result:
+                columns_by_table[col.table_name].append(col)
+            
             for table in tables:
-                result = conn.execute(text(f"""
-                    SELECT column_name, data_type, is_nullable
-                    FROM information_schema.columns 
-                    WHERE table_name = '{table}'
-                    ORDER BY ordinal_position
-                """))
-                
-                columns = result.fetchall()
+                columns = columns_by_table[table]
                 if columns:
                     print(f"\n✅ Table '{table}' created with {len(columns)} columns:")
                     for col in columns:
@@ -119,7 +161,7 @@ if __name__ == "__main__":
         sys.exit(1)
     
     # Create tables
-    if create_tables():
+    if create_tables(unlogged="--unlogged" in sys.argv):
         if verify_tables():
             print("\n🎉 Migration completed successfully!")
             print("\nNext steps:")
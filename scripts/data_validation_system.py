@@ -6,19 +6,23 @@ A comprehensive system for validating HTML parsing, tracking data quality issues
 and flagging content that requires manual review.
 """
 
+import atexit
+import gzip
 import json
 import logging
+import logging.handlers
+import queue
+import re
+from collections import Counter
+from functools import partial
+from itertools import chain
 from datetime import datetime
 from enum import Enum
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, asdict
 from typing import List, Dict, Optional, Any
 
-class EnumEncoder(json.JSONEncoder):
-    """Custom JSON encoder that handles enum values"""
-    def default(self, obj):
-        if isinstance(obj, Enum):
-            return obj.value
-        return super().default(obj)
+# Non-BMP codepoints, scanned in C rather than per-character in Python
+_HIGH_UNICODE = re.compile(r'[\U00010000-\U0010FFFF]')
 
 class IssueType(Enum):
     """Types of data quality issues that can be detected"""
@@ -56,7 +60,20 @@ class IssueSeverity(Enum):
     HIGH = "high"         # Likely affects user experience  
     CRITICAL = "critical" # Prevents proper processing
 
-@dataclass
+class EnumEncoder(json.JSONEncoder):
+    """Custom JSON encoder that handles enum values"""
+    # The set of enums is fixed, so resolve member -> value with one dict lookup
+    _enum_map = {m: m.value for E in (IssueType, IssueSeverity) for m in E}
+
+    def default(self, obj):
+        v = self._enum_map.get(obj)
+        if v is not None:
+            return v
+        if isinstance(obj, Enum):
+            return obj.value
+        return super().default(obj)
+
+@dataclass(slots=True)
 class ValidationIssue:
     """Individual validation issue"""
     issue_type: IssueType
@@ -71,7 +88,53 @@ class ValidationIssue:
         if self.timestamp is None:
             self.timestamp = datetime.now().isoformat()
 
-@dataclass 
+@dataclass(slots=True)
+class IssueTable:
+    """Validation issues for one song, stored column-wise
+    
+    Reporting only needs whole columns (issue types for the breakdown,
+    severities for scoring), so issues are kept as parallel lists of plain
+    values instead of one ValidationIssue object each. Iterating the table
+    still yields ValidationIssue objects for callers that want rows.
+    """
+    issue_types: List[str] = field(default_factory=list)
+    severities: List[str] = field(default_factory=list)
+    descriptions: List[str] = field(default_factory=list)
+    locations: List[str] = field(default_factory=list)
+    raw_contents: List[Optional[str]] = field(default_factory=list)
+    suggested_actions: List[Optional[str]] = field(default_factory=list)
+    timestamps: List[str] = field(default_factory=list)
+    
+    def add(self, issue_type: IssueType, severity: IssueSeverity, description: str,
+            location: str, raw_content: Optional[str] = None,
+            suggested_action: Optional[str] = None, timestamp: Optional[str] = None):
+        """Record an issue without creating a ValidationIssue"""
+        self.issue_types.append(issue_type.value)
+        self.severities.append(severity.value)
+        self.descriptions.append(description)
+        self.locations.append(location)
+        self.raw_contents.append(raw_content)
+        self.suggested_actions.append(suggested_action)
+        self.timestamps.append(timestamp if timestamp is not None else datetime.now().isoformat())
+    
+    def append(self, issue: ValidationIssue):
+        """Record an existing ValidationIssue"""
+        self.add(issue.issue_type, issue.severity, issue.description, issue.location,
+                 issue.raw_content, issue.suggested_action, issue.timestamp)
+    
+    def rows(self):
+        """Iterate issues as tuples of plain column values"""
+        return zip(self.issue_types, self.severities, self.descriptions, self.locations,
+                   self.raw_contents, self.suggested_actions, self.timestamps)
+    
+    def __len__(self):
+        return len(self.issue_types)
+    
+    def __iter__(self):
+        for issue_type, severity, *rest in self.rows():
+            yield ValidationIssue(IssueType(issue_type), IssueSeverity(severity), *rest)
+
+@dataclass(slots=True)
 class SongValidationResult:
     """Complete validation result for a song"""
     song_id: str
@@ -94,34 +157,58 @@ class SongValidationResult:
     processing_status: str = "pending"  # pending, processed, flagged, failed
     
     # Issue tracking
-    validation_issues: List[ValidationIssue] = None
+    validation_issues: IssueTable = None
     stray_text: List[str] = None  # Unidentifiable content
     processing_notes: str = ""
     
     def __post_init__(self):
         if self.validation_issues is None:
-            self.validation_issues = []
+            self.validation_issues = IssueTable()
         if self.stray_text is None:
             self.stray_text = []
 
 class HuapalaValidator:
     """Main validation and logging system"""
     
+    # Quality score deduction per issue, by severity value
+    _SEVERITY_PENALTY = {
+        IssueSeverity.CRITICAL.value: 25,
+        IssueSeverity.HIGH.value: 15,
+        IssueSeverity.MEDIUM.value: 8,
+        IssueSeverity.LOW.value: 3,
+    }
+    
+    # Severity values that always require manual review
+    _REVIEW_SEVERITIES = frozenset((IssueSeverity.CRITICAL.value, IssueSeverity.HIGH.value))
+    
     def __init__(self, log_file: str = "huapala_validation.log"):
         self.log_file = log_file
         self.setup_logging()
         self.validation_results: List[SongValidationResult] = []
+        self._batch_timestamp: Optional[str] = None
         
     def setup_logging(self):
-        """Configure logging system"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(self.log_file),
-                logging.StreamHandler()
-            ]
-        )
+        """Configure logging system
+        
+        Records are handed to a QueueHandler so validation only enqueues them;
+        a background QueueListener formats once per handler and does the I/O.
+        Like basicConfig, this leaves an already-configured root logger alone.
+        """
+        root = logging.getLogger()
+        if not root.handlers:
+            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+            file_handler = logging.FileHandler(self.log_file)
+            stream_handler = logging.StreamHandler()
+            file_handler.setFormatter(formatter)
+            stream_handler.setFormatter(formatter)
+            
+            log_queue = queue.SimpleQueue()
+            listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+            listener.start()
+            atexit.register(listener.stop)
+            
+            root.addHandler(logging.handlers.QueueHandler(log_queue))
+            root.setLevel(logging.INFO)
         self.logger = logging.getLogger(__name__)
     
     def validate_song(self, song_data: Dict) -> SongValidationResult:
@@ -135,14 +222,13 @@ class HuapalaValidator:
             verse_structure=[]
         )
         
-        # Validate attribution
-        self._validate_attribution(song_data, result)
-        
-        # Validate line structure
-        self._validate_line_structure(song_data, result)
-        
-        # Validate content quality
-        self._validate_content_quality(song_data, result)
+        # Issues found for this song share one timestamp
+        self._batch_timestamp = datetime.now().isoformat()
+        try:
+            # Validate attribution, line structure and content quality
+            self._validate_song_fields(song_data, result)
+        finally:
+            self._batch_timestamp = None
         
         # Calculate quality score
         result.data_quality_score = self._calculate_quality_score(result)
@@ -153,152 +239,171 @@ class HuapalaValidator:
         self.validation_results.append(result)
         return result
     
-    def _validate_attribution(self, song_data: Dict, result: SongValidationResult):
-        """Validate composer, lyricist, translator information"""
+    def _now_iso(self) -> str:
+        """Timestamp for new issues: the current song's if validating, else now"""
+        if self._batch_timestamp is not None:
+            return self._batch_timestamp
+        return datetime.now().isoformat()
+    
+    def _validate_song_fields(self, song_data: Dict, result: SongValidationResult):
+        """Validate attribution, line structure and content quality in one pass"""
+        get = song_data.get
+        add_issue = partial(result.validation_issues.add, timestamp=self._now_iso())
+        
+        # --- Attribution ---
         
         # Check for missing composer
-        composer = song_data.get('composer', '').strip()
+        composer = get('composer', '').strip()
         if not composer:
-            result.validation_issues.append(ValidationIssue(
+            add_issue(
                 issue_type=IssueType.NO_COMPOSER,
                 severity=IssueSeverity.HIGH,
                 description="No composer credited for this song",
                 location="attribution section"
-            ))
+            )
         else:
             result.composer = composer
             
         # Check for missing lyricist
-        lyricist = song_data.get('lyricist', '').strip()
+        lyricist = get('lyricist', '').strip()
         if not lyricist:
-            result.validation_issues.append(ValidationIssue(
+            add_issue(
                 issue_type=IssueType.NO_LYRICIST,
                 severity=IssueSeverity.MEDIUM,
                 description="No lyricist credited for this song",
                 location="attribution section"
-            ))
+            )
         else:
             result.lyricist = lyricist
             
         # Check for missing translator
-        translator = song_data.get('translator', '').strip()
-        if not translator and song_data.get('has_english_translation', False):
-            result.validation_issues.append(ValidationIssue(
+        translator = get('translator', '').strip()
+        if not translator and get('has_english_translation', False):
+            add_issue(
                 issue_type=IssueType.NO_TRANSLATOR,
                 severity=IssueSeverity.MEDIUM,
                 description="Song has English translation but no translator credited",
                 location="attribution section"
-            ))
+            )
         else:
             result.translator = translator
-    
-    def _validate_line_structure(self, song_data: Dict, result: SongValidationResult):
-        """Validate Hawaiian/English line alignment and structure"""
         
-        hawaiian_lines = song_data.get('hawaiian_lines', [])
-        english_lines = song_data.get('english_lines', [])
+        # --- Line structure ---
+        
+        hawaiian_lines = get('hawaiian_lines', [])
+        english_lines = get('english_lines', [])
+        hawaiian_count = len(hawaiian_lines)
+        english_count = len(english_lines)
         
         result.hawaiian_lines = hawaiian_lines
         result.english_lines = english_lines
         
         # Check for line count mismatch
-        if len(hawaiian_lines) != len(english_lines):
-            result.validation_issues.append(ValidationIssue(
+        if hawaiian_count != english_count:
+            add_issue(
                 issue_type=IssueType.LINE_COUNT_MISMATCH,
                 severity=IssueSeverity.HIGH,
-                description=f"Hawaiian lines ({len(hawaiian_lines)}) don't match English lines ({len(english_lines)})",
+                description=f"Hawaiian lines ({hawaiian_count}) don't match English lines ({english_count})",
                 location="lyrics section",
                 suggested_action="Manual review required to align translations"
-            ))
+            )
         
         # Check for missing translation
-        if hawaiian_lines and not english_lines:
-            result.validation_issues.append(ValidationIssue(
+        if hawaiian_count and not english_count:
+            add_issue(
                 issue_type=IssueType.MISSING_TRANSLATION,
                 severity=IssueSeverity.MEDIUM,
                 description="Song has Hawaiian lyrics but no English translation",
                 location="lyrics section"
-            ))
+            )
             
         # Check for verse/chorus structure
-        if not song_data.get('has_verse_structure', False):
-            result.validation_issues.append(ValidationIssue(
+        if not get('has_verse_structure', False):
+            add_issue(
                 issue_type=IssueType.NO_VERSE_CHORUS_STRUCTURE,
                 severity=IssueSeverity.MEDIUM,
                 description="Unable to identify clear verse/chorus structure",
                 location="lyrics section"
-            ))
-    
-    def _validate_content_quality(self, song_data: Dict, result: SongValidationResult):
-        """Validate content quality and identify stray text"""
+            )
+        
+        # --- Content quality ---
         
         # Check for stray/unidentifiable text
-        stray_text = song_data.get('stray_text', [])
+        stray_text = get('stray_text', [])
         if stray_text:
             result.stray_text = stray_text
-            result.validation_issues.append(ValidationIssue(
+            add_issue(
                 issue_type=IssueType.UNIDENTIFIABLE_TEXT,
                 severity=IssueSeverity.MEDIUM,
                 description=f"Found {len(stray_text)} segments of unidentifiable text",
                 location="various",
                 raw_content=str(stray_text)[:200],  # First 200 chars
                 suggested_action="Manual review to categorize or discard"
-            ))
+            )
         
         # Check for encoding issues
-        all_text = ' '.join(result.hawaiian_lines + result.english_lines)
-        if any(ord(c) > 65535 for c in all_text):  # Non-BMP characters
-            result.validation_issues.append(ValidationIssue(
+        if any(_HIGH_UNICODE.search(line)  # Non-BMP characters
+               for line in chain(hawaiian_lines, english_lines)):
+            add_issue(
                 issue_type=IssueType.ENCODING_ISSUES,
                 severity=IssueSeverity.LOW,
                 description="Contains unusual Unicode characters",
                 location="lyrics content"
-            ))
+            )
     
     def _calculate_quality_score(self, result: SongValidationResult) -> float:
         """Calculate data quality score (0-100)"""
-        score = 100.0
-        
-        for issue in result.validation_issues:
-            if issue.severity == IssueSeverity.CRITICAL:
-                score -= 25
-            elif issue.severity == IssueSeverity.HIGH:
-                score -= 15
-            elif issue.severity == IssueSeverity.MEDIUM:
-                score -= 8
-            elif issue.severity == IssueSeverity.LOW:
-                score -= 3
-                
+        penalty = self._SEVERITY_PENALTY
+        score = 100.0 - sum(penalty.get(severity, 0)
+                            for severity in result.validation_issues.severities)
         return max(0.0, score)
     
     def _requires_manual_review(self, result: SongValidationResult) -> bool:
         """Determine if song requires manual review"""
-        critical_issues = [i for i in result.validation_issues 
-                          if i.severity in [IssueSeverity.CRITICAL, IssueSeverity.HIGH]]
+        review_severities = self._REVIEW_SEVERITIES
+        has_critical_issues = any(severity in review_severities
+                                  for severity in result.validation_issues.severities)
         
         return (
-            len(critical_issues) > 0 or
+            has_critical_issues or
             result.data_quality_score < 70 or
             len(result.stray_text) > 0 or
             len(result.validation_issues) > 5
         )
     
-    def generate_report(self, output_file: str = "validation_report.json"):
-        """Generate comprehensive validation report"""
+    def generate_report(self, output_file: str = "validation_report.json",
+                        compress: bool = False, pretty: bool = False):
+        """Generate comprehensive validation report
+        
+        With compress=True the report is written compact and ASCII-escaped to
+        output_file + '.gz'; pass pretty=True to keep indentation for debugging.
+        """
+        # Convert each result once; the review list shares the same dicts
+        all_dicts = [asdict(r) for r in self.validation_results]
         report = {
             "generation_timestamp": datetime.now().isoformat(),
             "total_songs_processed": len(self.validation_results),
             "summary": self._generate_summary(),
             "songs_requiring_review": [
-                asdict(r) for r in self.validation_results 
+                d for d, r in zip(all_dicts, self.validation_results)
                 if r.manual_review_required
             ],
             "issue_breakdown": self._generate_issue_breakdown(),
-            "all_results": [asdict(r) for r in self.validation_results]
+            "all_results": all_dicts
         }
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False, cls=EnumEncoder)
+        # json.dump writes encoder chunks as they are produced rather than
+        # building the whole document as one string first
+        if compress:
+            output_file += '.gz'
+            with gzip.open(output_file, 'wt', encoding='utf-8') as f:
+                if pretty:
+                    json.dump(report, f, indent=2, ensure_ascii=True, cls=EnumEncoder)
+                else:
+                    json.dump(report, f, separators=(',', ':'), ensure_ascii=True, cls=EnumEncoder)
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False, cls=EnumEncoder)
             
         self.logger.info(f"Validation report generated: {output_file}")
         return report
@@ -322,15 +427,13 @@ class HuapalaValidator:
     
     def _generate_issue_breakdown(self) -> Dict:
         """Generate breakdown of issues by type"""
-        issue_counts = {}
-        for result in self.validation_results:
-            for issue in result.validation_issues:
-                issue_type = issue.issue_type.value
-                if issue_type not in issue_counts:
-                    issue_counts[issue_type] = 0
-                issue_counts[issue_type] += 1
+        issue_counts = Counter(chain.from_iterable(
+            result.validation_issues.issue_types
+            for result in self.validation_results
+        ))
         
-        return dict(sorted(issue_counts.items(), key=lambda x: x[1], reverse=True))
+        # most_common() is already sorted by count, descending
+        return dict(issue_counts.most_common())
 
 # Example usage
 if __name__ == "__main__":
@@ -4,20 +4,113 @@ Database-integrated validation system for Huapala
 Extends the existing validation system to work with Neon PostgreSQL
 """
 
+import io
 import os
 import sys
+import json
 import psycopg2
 import psycopg2.extras
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from psycopg2.pool import ThreadedConnectionPool
 from datetime import datetime
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 # Add parent directory to path so we can import scripts modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from scripts.data_validation_system import HuapalaValidator, SongValidationResult, ValidationIssue
 
+# SQL used by DatabaseValidator, built once at import
+
+_SQL_START_SESSION = """
+    INSERT INTO validation_sessions (session_name, started_at, status)
+    VALUES (%s, %s, 'running')
+    RETURNING id
+"""
+
+_SQL_COMPLETE_SESSION = """
+    UPDATE validation_sessions vs
+    SET completed_at = %s,
+        songs_processed = s.total_processed,
+        songs_flagged = s.flagged,
+        average_quality_score = s.avg_quality,
+        status = 'completed'
+    FROM (
+        SELECT 
+            COUNT(*) as total_processed,
+            COUNT(*) FILTER (WHERE manual_review_required) as flagged,
+            ROUND(AVG(data_quality_score), 2) as avg_quality
+        FROM song_validations 
+        WHERE validation_session_id = %s
+    ) s
+    WHERE vs.id = %s
+    RETURNING s.total_processed, s.flagged, s.avg_quality
+"""
+
+# Flush statement pieces; see DatabaseValidator._build_flush_sql
+_SQL_NEW_IDS = """
+    WITH new_ids AS (
+        SELECT array_agg(nextval(pg_get_serial_sequence('song_validations', 'id'))) AS ids
+        FROM generate_series(1, %s)
+    )
+"""
+_SQL_INSERT_SONG_VALIDATIONS = b"""
+    INSERT INTO song_validations (
+        id, canonical_mele_id, validation_session_id, data_quality_score,
+        manual_review_required, processing_status, total_hawaiian_lines,
+        total_english_lines, has_verse_structure, has_english_translation,
+        parser_version, source_file_path, processing_notes, stray_text
+    ) VALUES """
+_SQL_INSERT_VALIDATION_ISSUES = b"""
+    INSERT INTO validation_issues (
+        song_validation_id, issue_type, severity, description,
+        location, raw_content, suggested_action
+    ) VALUES """
+_SQL_COPY_VALIDATION_ISSUES = """
+    COPY validation_issues (
+        song_validation_id, issue_type, severity, description,
+        location, raw_content, suggested_action
+    ) FROM STDIN WITH (FORMAT CSV, QUOTE '"')
+"""
+_SQL_SONG_VALIDATION_ROW = "((SELECT ids[%s] FROM new_ids), %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s::jsonb)"
+_SQL_VALIDATION_ISSUE_ROW = "((SELECT ids[%s] FROM new_ids), %s, %s, %s, %s, %s, %s)"
+
+_SQL_SELECT_NEEDS_REVIEW = "SELECT * FROM songs_needing_review ORDER BY data_quality_score ASC"
+_SQL_SELECT_SUMMARY = "SELECT * FROM validation_summary WHERE session_id = %s"
+_SQL_SELECT_ALL_SUMMARIES = "SELECT * FROM validation_summary ORDER BY started_at DESC"
+_SQL_SONG_VALIDATION_DETAILS = "SELECT * FROM get_song_validation_details($1)"
+
+def _csv_field(value) -> str:
+    """Format one COPY CSV field; None stays unquoted so COPY reads it as NULL"""
+    if value is None:
+        return ''
+    if isinstance(value, int):
+        return str(value)
+    return '"' + str(value).replace('"', '""') + '"'
+
 class DatabaseValidator(HuapalaValidator):
     """Validation system integrated with Neon PostgreSQL database"""
     
+    # Number of queued songs that triggers a batched write
+    FLUSH_EVERY = 500
+    
+    # Connections kept open by the pool
+    POOL_MIN_CONN = 1
+    POOL_MAX_CONN = 8
+    
+    # Issue rows sent per COPY by bulk_backfill_issues
+    BACKFILL_CHUNK = 50000
+    
+    # Rows fetched per round trip when streaming the review queue
+    REVIEW_FETCH_SIZE = 500
+    
+    # Statements prepared server-side on first use, per connection
+    PREPARED_STATEMENTS = {
+        'get_song_valid': _SQL_SONG_VALIDATION_DETAILS,
+    }
+    
     def __init__(self, connection_string: str = None):
         super().__init__()
         
@@ -29,10 +122,28 @@ class DatabaseValidator(HuapalaValidator):
         self.conn = None
         self.current_session_id = None
         
+        # Created on first use so constructing a validator stays offline
+        self._pool: Optional[ThreadedConnectionPool] = None
+        
+        # (connection, statement name) pairs already PREPAREd
+        self._prepared = set()
+        
+        # Validation rows waiting for flush_pending(); one issue list per parent
+        self._pending_parents: List[tuple] = []
+        self._pending_issues: List[List[tuple]] = []
+        
+    def _get_pool(self) -> ThreadedConnectionPool:
+        """Return the connection pool, opening it on first use"""
+        if self._pool is None:
+            self._pool = ThreadedConnectionPool(
+                self.POOL_MIN_CONN, self.POOL_MAX_CONN, self.connection_string
+            )
+        return self._pool
+    
     def connect(self):
-        """Connect to the database"""
+        """Lease the session connection from the pool"""
         try:
-            self.conn = psycopg2.connect(self.connection_string)
+            self.conn = self._get_pool().getconn()
             self.conn.autocommit = False  # We'll manage transactions
             self.logger.info("Connected to Neon PostgreSQL database")
         except Exception as e:
@@ -40,24 +151,55 @@ class DatabaseValidator(HuapalaValidator):
             raise
     
     def disconnect(self):
-        """Close database connection"""
+        """Write anything still queued, then return the session connection and close the pool"""
+        if self._pending_parents:
+            if not self.conn:
+                raise RuntimeError(f"{len(self._pending_parents)} validation results are "
+                                   f"queued but there is no connection to write them")
+            self.flush_pending()
+        
         if self.conn:
-            self.conn.close()
+            self._pool.putconn(self.conn)
             self.conn = None
             self.logger.info("Disconnected from database")
+        if self._pool is not None:
+            self._pool.closeall()
+            self._pool = None
+        self._prepared.clear()
+    
+    def __enter__(self):
+        """Hold one connection for the lifetime of the with block"""
+        self.connect()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disconnect()
+        return False
+    
+    @contextmanager
+    def _cursor(self, cursor_factory=None, name=None):
+        """Yield a cursor on the session connection, or on a pooled one if none is held
+        
+        Passing a name opens a server-side cursor that fetches rows in batches.
+        """
+        if self.conn:
+            with self.conn.cursor(name=name, cursor_factory=cursor_factory) as cursor:
+                yield cursor
+            return
+        
+        pool = self._get_pool()
+        conn = pool.getconn()
+        try:
+            with conn.cursor(name=name, cursor_factory=cursor_factory) as cursor:
+                yield cursor
+        finally:
+            pool.putconn(conn)
     
     def start_validation_session(self, session_name: str) -> int:
         """Start a new validation session and return session ID"""
-        if not self.conn:
-            self.connect()
-        
         try:
             with self.conn.cursor() as cursor:
-                cursor.execute("""
-                    INSERT INTO validation_sessions (session_name, started_at, status)
-                    VALUES (%s, %s, 'running')
-                    RETURNING id
-                """, (session_name, datetime.now()))
+                cursor.execute(_SQL_START_SESSION, (session_name, datetime.now()))
                 
                 session_id = cursor.fetchone()[0]
                 self.current_session_id = session_id
@@ -72,112 +214,187 @@ class DatabaseValidator(HuapalaValidator):
             raise
     
     def validate_and_store_song(self, song_data: Dict, canonical_mele_id: int) -> SongValidationResult:
-        """Validate a song and store results in database"""
+        """Validate a song and queue its results for the database
+        
+        Use store_validation_result() directly to see which songs a flush wrote.
+        """
         
         # Run the standard validation
         validation_result = self.validate_song(song_data)
         
-        # Store in database
+        # Queue for the database
         self.store_validation_result(validation_result, canonical_mele_id, song_data)
         
         return validation_result
     
-    def store_validation_result(self, result: SongValidationResult, canonical_mele_id: int, song_data: Dict):
-        """Store validation results in the database"""
-        if not self.conn:
-            self.connect()
+    def store_validation_result(self, result: SongValidationResult, canonical_mele_id: int,
+                                song_data: Dict) -> List[Tuple[str, Optional[str]]]:
+        """Queue validation results for the database
         
+        Rows are buffered and written by flush_pending() every FLUSH_EVERY
+        songs and when the session completes. A song only counts as stored
+        once a flush reports it: this returns the per-song results of the
+        flush it triggered, or an empty list if the song is still queued.
+        """
         if not self.current_session_id:
             raise ValueError("No active validation session. Call start_validation_session() first.")
         
+        self._pending_parents.append((
+            canonical_mele_id,
+            self.current_session_id,
+            result.data_quality_score,
+            result.manual_review_required,
+            result.processing_status,
+            len(result.hawaiian_lines),
+            len(result.english_lines),
+            song_data.get('has_verse_structure', False),
+            song_data.get('has_english_translation', False),
+            "1.0",  # Parser version
+            song_data.get('source_file', ''),
+            result.processing_notes,
+            # Serialized here once and cast to jsonb by the row template
+            json.dumps(result.stray_text, separators=(',', ':'), ensure_ascii=False)
+            if result.stray_text else None
+        ))
+        
+        issues = result.validation_issues
+        self._pending_issues.append(list(zip(
+            issues.issue_types,
+            issues.severities,
+            issues.descriptions,
+            issues.locations,
+            issues.raw_contents,
+            issues.suggested_actions
+        )))
+        
+        if len(self._pending_parents) >= self.FLUSH_EVERY:
+            return self.flush_pending()
+        return []
+    
+    def flush_pending(self) -> List[Tuple[str, Optional[str]]]:
+        """Write queued validation results, parents and issues, in one statement
+        
+        If the batched statement fails, it is rolled back and the songs are
+        written again one at a time, so a single bad row only loses itself.
+        Returns (source_file, error) for every song written, in queue order,
+        with error None for songs that were stored.
+        """
+        if not self._pending_parents:
+            return []
+        
+        parents, pending_issues = self._pending_parents, self._pending_issues
+        self._pending_parents, self._pending_issues = [], []
+        
         try:
             with self.conn.cursor() as cursor:
-                # Insert song validation record
-                cursor.execute("""
-                    INSERT INTO song_validations (
-                        canonical_mele_id, validation_session_id, data_quality_score,
-                        manual_review_required, processing_status, total_hawaiian_lines,
-                        total_english_lines, has_verse_structure, has_english_translation,
-                        parser_version, source_file_path, processing_notes, stray_text
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    RETURNING id
-                """, (
-                    canonical_mele_id,
-                    self.current_session_id,
-                    result.data_quality_score,
-                    result.manual_review_required,
-                    result.processing_status,
-                    len(result.hawaiian_lines),
-                    len(result.english_lines),
-                    song_data.get('has_verse_structure', False),
-                    song_data.get('has_english_translation', False),
-                    "1.0",  # Parser version
-                    song_data.get('source_file', ''),
-                    result.processing_notes,
-                    psycopg2.extras.Json(result.stray_text) if result.stray_text else None
-                ))
-                
-                song_validation_id = cursor.fetchone()[0]
+                cursor.execute(self._build_flush_sql(cursor, parents, pending_issues))
+                self.conn.commit()
+                self.logger.info(f"Stored validation results for {len(parents)} songs")
+                return [(parent[10], None) for parent in parents]
                 
-                # Insert validation issues
-                for issue in result.validation_issues:
-                    cursor.execute("""
-                        INSERT INTO validation_issues (
-                            song_validation_id, issue_type, severity, description,
-                            location, raw_content, suggested_action
-                        ) VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    """, (
-                        song_validation_id,
-                        issue.issue_type.value,
-                        issue.severity.value,
-                        issue.description,
-                        issue.location,
-                        issue.raw_content,
-                        issue.suggested_action
-                    ))
+        except Exception as e:
+            self.conn.rollback()
+            self.logger.warning(f"Batched write of {len(parents)} songs failed ({e}); "
+                                f"retrying one song at a time")
+        
+        outcomes = []
+        for parent, issues in zip(parents, pending_issues):
+            try:
+                with self.conn.cursor() as cursor:
+                    cursor.execute(self._build_flush_sql(cursor, [parent], [issues]))
+                    self.conn.commit()
+                    outcomes.append((parent[10], None))
+                    
+            except Exception as e:
+                self.conn.rollback()
+                self.logger.error(f"Failed to store validation results for "
+                                  f"{parent[10] or parent[0]}: {e}")
+                outcomes.append((parent[10], str(e)))
+        
+        return outcomes
+    
+    @staticmethod
+    def _build_flush_sql(cursor, parents: List[tuple], pending_issues: List[List[tuple]]) -> bytes:
+        """Build a single statement inserting queued parents and their issues
+        
+        Parent ids are drawn from the song_validations sequence inside the
+        statement, so issue rows can reference their parent by position and
+        no RETURNING round trip is needed before inserting them.
+        """
+        parent_values = b','.join(
+            cursor.mogrify(_SQL_SONG_VALIDATION_ROW, (position,) + parent)
+            for position, parent in enumerate(parents, 1)
+        )
+        issue_values = b','.join(
+            cursor.mogrify(_SQL_VALIDATION_ISSUE_ROW, (position,) + issue)
+            for position, issues in enumerate(pending_issues, 1)
+            for issue in issues
+        )
+        
+        new_ids = cursor.mogrify(_SQL_NEW_IDS, (len(parents),))
+        insert_parents = _SQL_INSERT_SONG_VALIDATIONS + parent_values
+        
+        if not issue_values:
+            return new_ids + insert_parents
+        
+        return (new_ids + b", parents AS (" + insert_parents + b")"
+                + _SQL_INSERT_VALIDATION_ISSUES + issue_values)
+    
+    def bulk_backfill_issues(self, rows_iter: Iterable[tuple]) -> int:
+        """COPY validation_issues rows straight into the table
+        
+        Each row is (song_validation_id, issue_type, severity, description,
+        location, raw_content, suggested_action). Meant for backfills and
+        migrations: everything is committed together at the end rather than
+        per song, and rows are sent BACKFILL_CHUNK at a time to bound memory.
+        Returns the number of rows copied.
+        """
+        rows_iter = iter(rows_iter)
+        total = 0
+        
+        try:
+            with self.conn.cursor() as cursor:
+                while True:
+                    chunk = list(islice(rows_iter, self.BACKFILL_CHUNK))
+                    if not chunk:
+                        break
+                    
+                    buffer = io.StringIO()
+                    for row in chunk:
+                        buffer.write(','.join(map(_csv_field, row)))
+                        buffer.write('\n')
+                    buffer.seek(0)
+                    
+                    cursor.copy_expert(_SQL_COPY_VALIDATION_ISSUES, buffer)
+                    total += len(chunk)
                 
                 self.conn.commit()
-                self.logger.info(f"Stored validation results for song {canonical_mele_id}")
+                self.logger.info(f"Backfilled {total} validation issues")
+                return total
                 
         except Exception as e:
             self.conn.rollback()
-            self.logger.error(f"Failed to store validation results: {e}")
+            self.logger.error(f"Failed to backfill validation issues: {e}")
             raise
     
     def complete_validation_session(self):
         """Mark the current validation session as complete and update statistics"""
+        if self.current_session_id and self._pending_parents:
+            self.flush_pending()
+        
         if not self.conn or not self.current_session_id:
             return
         
         try:
             with self.conn.cursor() as cursor:
-                # Calculate session statistics
-                cursor.execute("""
-                    SELECT 
-                        COUNT(*) as total_processed,
-                        COUNT(CASE WHEN manual_review_required THEN 1 END) as flagged,
-                        ROUND(AVG(data_quality_score), 2) as avg_quality
-                    FROM song_validations 
-                    WHERE validation_session_id = %s
-                """, (self.current_session_id,))
-                
-                stats = cursor.fetchone()
-                total_processed, flagged, avg_quality = stats
-                
-                # Update session record
-                cursor.execute("""
-                    UPDATE validation_sessions 
-                    SET completed_at = %s, songs_processed = %s, songs_flagged = %s,
-                        average_quality_score = %s, status = 'completed'
-                    WHERE id = %s
-                """, (
-                    datetime.now(),
-                    total_processed,
-                    flagged,
-                    avg_quality,
-                    self.current_session_id
+                # Calculate session statistics and update the session record
+                # in one statement
+                cursor.execute(_SQL_COMPLETE_SESSION, (
+                    datetime.now(), self.current_session_id, self.current_session_id
                 ))
                 
+                total_processed, flagged, avg_quality = cursor.fetchone() or (0, 0, None)
+                
                 self.conn.commit()
                 self.logger.info(f"Completed validation session {self.current_session_id}: "
                                f"{total_processed} songs, {flagged} flagged, {avg_quality} avg quality")
@@ -189,74 +406,101 @@ class DatabaseValidator(HuapalaValidator):
             self.logger.error(f"Failed to complete validation session: {e}")
             raise
     
-    def get_songs_needing_review(self) -> List[Dict]:
-        """Get all songs that require manual review"""
-        if not self.conn:
-            self.connect()
-        
-        with self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
-            cursor.execute("SELECT * FROM songs_needing_review ORDER BY data_quality_score ASC")
-            return [dict(row) for row in cursor.fetchall()]
+    def _execute_prepared(self, cursor, name: str, params: tuple):
+        """EXECUTE a named statement, PREPAREing it on this connection if needed"""
+        key = (cursor.connection, name)
+        if key not in self._prepared:
+            cursor.execute(f"PREPARE {name} AS {self.PREPARED_STATEMENTS[name]}")
+            self._prepared.add(key)
+        placeholders = ', '.join(['%s'] * len(params))
+        cursor.execute(f"EXECUTE {name}({placeholders})", params)
+    
+    def get_songs_needing_review(self) -> Iterator[Dict]:
+        """Yield songs that require manual review, lowest quality first
+        
+        Rows are streamed from a server-side cursor REVIEW_FETCH_SIZE at a time.
+        """
+        with self._cursor(psycopg2.extras.RealDictCursor, name='songs_review_cur') as cursor:
+            cursor.itersize = self.REVIEW_FETCH_SIZE
+            cursor.execute(_SQL_SELECT_NEEDS_REVIEW)
+            # RealDictRow is already a dict, so rows are yielded as-is
+            yield from cursor
     
     def get_validation_summary(self, session_id: int = None) -> Dict:
         """Get validation summary for a session or all sessions"""
-        if not self.conn:
-            self.connect()
-        
-        with self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+        with self._cursor(psycopg2.extras.RealDictCursor) as cursor:
             if session_id:
-                cursor.execute("SELECT * FROM validation_summary WHERE session_id = %s", (session_id,))
+                cursor.execute(_SQL_SELECT_SUMMARY, (session_id,))
                 result = cursor.fetchone()
                 return dict(result) if result else {}
             else:
-                cursor.execute("SELECT * FROM validation_summary ORDER BY started_at DESC")
-                return [dict(row) for row in cursor.fetchall()]
+                cursor.execute(_SQL_SELECT_ALL_SUMMARIES)
+                # Build the row list once rather than fetchall() plus dict copies
+                return list(cursor)
     
     def get_song_validation_details(self, canonical_mele_id: int) -> Dict:
         """Get detailed validation information for a specific song"""
-        if not self.conn:
-            self.connect()
-        
-        with self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
-            cursor.execute("SELECT * FROM get_song_validation_details(%s)", (canonical_mele_id,))
+        with self._cursor(psycopg2.extras.RealDictCursor) as cursor:
+            self._execute_prepared(cursor, 'get_song_valid', (canonical_mele_id,))
             result = cursor.fetchone()
             return dict(result) if result else {}
 
 # Example usage functions
-def batch_validate_songs(song_files: List[str], parser, db_validator: DatabaseValidator):
-    """Validate multiple songs and store results"""
+def _parse_song_file(parser, song_file: str):
+    """Parse one file in a worker process, returning the error instead of raising"""
+    try:
+        return parser.parse_file(song_file), None
+    except Exception as e:
+        return None, e
+
+def batch_validate_songs(song_files: List[str], parser, db_validator: DatabaseValidator,
+                         max_workers: Optional[int] = None):
+    """Validate multiple songs and store results
     
-    session_name = f"batch_validation_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-    session_id = db_validator.start_validation_session(session_name)
+    Files are parsed in parallel worker processes; validation and database
+    writes stay in this process, in file order.
+    """
     
-    try:
-        for song_file in song_files:
-            try:
-                # Parse the song
-                parsed_song, validation_result = parser.parse_file(song_file)
-                
-                # Find or create canonical_mele record (you'd implement this)
-                canonical_mele_id = find_or_create_canonical_mele(parsed_song)
-                
-                # Validate and store
-                db_validator.validate_and_store_song(
-                    parser._prepare_validation_data(parsed_song),
-                    canonical_mele_id
-                )
-                
-                print(f"Processed: {song_file}")
-                
-            except Exception as e:
-                print(f"Failed to process {song_file}: {e}")
-                continue
+    with db_validator, ProcessPoolExecutor(max_workers=max_workers) as pool:
+        session_name = f"batch_validation_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        session_id = db_validator.start_validation_session(session_name)
         
-        db_validator.complete_validation_session()
+        def report(outcomes):
+            for source_file, error in outcomes:
+                if error is None:
+                    print(f"Processed: {source_file}")
+                else:
+                    print(f"Failed to store {source_file}: {error}")
         
-    except Exception as e:
-        print(f"Batch validation failed: {e}")
-        raise
-    finally:
-        db_validator.disconnect()
+        try:
+            parsed_files = pool.map(partial(_parse_song_file, parser), song_files, chunksize=8)
+            for song_file, (parsed, parse_error) in zip(song_files, parsed_files):
+                try:
+                    if parse_error is not None:
+                        raise parse_error
+                    
+                    # Parse the song
+                    parsed_song, validation_result = parsed
+                    
+                    # Find or create canonical_mele record (you'd implement this)
+                    canonical_mele_id = find_or_create_canonical_mele(parsed_song)
+                    
+                    # Validate and queue; songs are reported once a flush writes them
+                    song_data = parser._prepare_validation_data(parsed_song)
+                    report(db_validator.store_validation_result(
+                        db_validator.validate_song(song_data), canonical_mele_id, song_data
+                    ))
+                    
+                except Exception as e:
+                    print(f"Failed to process {song_file}: {e}")
+                    continue
+            
+            report(db_validator.flush_pending())
+            db_validator.complete_validation_session()
+            
+        except Exception as e:
+            print(f"Batch validation failed: {e}")
+            raise
 
 def find_or_create_canonical_mele(parsed_song) -> int:
     """Find existing or create new canonical_mele record"""
@@ -266,21 +510,15 @@ def find_or_create_canonical_mele(parsed_song) -> int:
 
 if __name__ == "__main__":
     # Test the database validator
-    db_validator = DatabaseValidator()
-    
     try:
-        # Test connection
-        db_validator.connect()
-        
-        # Test session management
-        session_id = db_validator.start_validation_session("test_session")
-        print(f"Started session: {session_id}")
-        
-        # Get validation summary
-        summary = db_validator.get_validation_summary()
-        print(f"Validation summary: {summary}")
+        with DatabaseValidator() as db_validator:
+            # Test session management
+            session_id = db_validator.start_validation_session("test_session")
+            print(f"Started session: {session_id}")
+            
+            # Get validation summary
+            summary = db_validator.get_validation_summary()
+            print(f"Validation summary: {summary}")
         
     except Exception as e:
-        print(f"Error: {e}")
-    finally:
-        db_validator.disconnect()
\ No newline at end of file
+        print(f"Error: {e}")
\ No newline at end of file
@@ -1,31 +1,41 @@
 #!/usr/bin/env python3
 
-import json
-from database import SessionLocal, MeleSources
+import io
+import sys
+from sqlalchemy import select
+from database import SessionLocal, MeleSources, load_verses_json
 
 def debug_all_verses(song_id="bye_and_bye_hoi_mai_canonical"):
     """Debug all verses in the song"""
     db = SessionLocal()
+    # Collect the report and write it to stdout in one call
+    out = io.StringIO()
     try:
-        source = db.query(MeleSources).filter(MeleSources.canonical_mele_id == song_id).first()
+        # Only verses_json is read, so skip building a mapped instance
+        source = db.execute(
+            select(MeleSources.verses_json)
+            .where(MeleSources.canonical_mele_id == song_id)
+            .limit(1)
+        ).one_or_none()
         if source and source.verses_json:
-            verses_data = json.loads(source.verses_json)
-            print(f"Total verses: {len(verses_data)}")
+            verses_data = load_verses_json(source.verses_json)
+            print(f"Total verses: {len(verses_data)}", file=out)
             
             for i, verse in enumerate(verses_data):
-                print(f"\n=== VERSE {i+1} ===")
-                print(f"ID: {verse.get('id')}")
-                print(f"Type: {verse.get('type')}")
-                print(f"Number: {verse.get('number')}")
-                print(f"Label: {verse.get('label')}")
-                print(f"Lines: {len(verse.get('lines', []))}")
+                print(f"\n=== VERSE {i+1} ===", file=out)
+                print(f"ID: {verse.get('id')}", file=out)
+                print(f"Type: {verse.get('type')}", file=out)
+                print(f"Number: {verse.get('number')}", file=out)
+                print(f"Label: {verse.get('label')}", file=out)
+                print(f"Lines: {len(verse.get('lines', []))}", file=out)
                 
                 for j, line in enumerate(verse.get('lines', [])):
-                    print(f"  {j+1}: '{line.get('hawaiian_text', 'NO_HAW')}' | '{line.get('english_text', 'NO_ENG')}'")
+                    print(f"  {j+1}: '{line.get('hawaiian_text', 'NO_HAW')}' | '{line.get('english_text', 'NO_ENG')}'", file=out)
         else:
-            print("No verses found!")
+            print("No verses found!", file=out)
     finally:
         db.close()
+        sys.stdout.write(out.getvalue())
 
 if __name__ == "__main__":
     debug_all_verses()
\ No newline at end of file
@@ -3,6 +3,7 @@
 Debug script to examine corrupted verse structure
 """
 import os
+import ast
 import json
 from sqlalchemy import create_engine, text
 # Add parent directory to path to import auth
@@ -14,22 +15,35 @@ from auth import get_database_url
 # Database connection
 DB_URL = get_database_url()
 
+# Reused across calls so repeated runs from a REPL keep the same pool
+_ENGINE = None
+
+def _engine():
+    global _ENGINE
+    if _ENGINE is None:
+        _ENGINE = create_engine(DB_URL, pool_size=2, pool_pre_ping=True)
+    return _ENGINE
+
 def examine_corrupted_songs():
-    engine = create_engine(DB_URL)
+    engine = _engine()
     
     with engine.connect() as conn:
         # Get the corrupted songs
         corrupted_songs = ['mahina_o_hoku_canonical', 'iesu_me_ke_kanaka_waiwai_canonical']
         
+        # Fetch all of them in one round trip
+        query = text("""
+        SELECT canonical_mele_id, verses_json 
+        FROM mele_sources 
+        WHERE canonical_mele_id = ANY(:ids)
+        """)
+        
+        rows_by_song = {}
+        for row in conn.execute(query, {"ids": corrupted_songs}):
+            rows_by_song.setdefault(row[0], row)
+        
         for song_id in corrupted_songs:
-            query = text("""
-            SELECT canonical_mele_id, verses_json 
-            FROM mele_sources 
-            WHERE canonical_mele_id = :song_id
-            """)
-            
-            result = conn.execute(query, {"song_id": song_id})
-            row = result.fetchone()
+            row = rows_by_song.get(song_id)
             
             if row:
                 verses_json = row[1]
@@ -57,8 +71,8 @@ def examine_corrupted_songs():
                             # Check if it looks like a Python list representation
                             if verses_json.startswith('[') and verses_json.endswith(']'):
                                 print("Looks like a string representation of a list")
-                                # Try to eval it (dangerous but for debugging)
-                                evaluated = eval(verses_json)
+                                # Evaluate it as a Python literal
+                                evaluated = ast.literal_eval(verses_json)
                                 print(f"Evaluated to: {type(evaluated)} with {len(evaluated)} items")
                                 for i, item in enumerate(evaluated[:3]):
                                     print(f"  Item {i}: {type(item)} - {repr(item)[:100]}")
@@ -34,23 +34,16 @@ def debug_mele_sources():
         
         print("🔍 Analyzing mele_sources table...")
         
-        # Get table schema
+        # Schema and primary key in one round trip, tagged so each row
+        # reaches the right printer
         cur.execute("""
-            SELECT column_name, data_type, is_nullable, column_default
+            SELECT 'col' AS tag, column_name::text, data_type::text, is_nullable::text,
+                   column_default::text, ordinal_position::int
             FROM information_schema.columns 
             WHERE table_name = 'mele_sources'
             AND table_schema = 'public'
-            ORDER BY ordinal_position
-        """)
-        
-        columns = cur.fetchall()
-        print("\n📋 Table Schema:")
-        for col in columns:
-            print(f"   - {col[0]}: {col[1]} {'NULL' if col[2] == 'YES' else 'NOT NULL'} {f'DEFAULT {col[3]}' if col[3] else ''}")
-        
-        # Get primary key info
-        cur.execute("""
-            SELECT kcu.column_name
+            UNION ALL
+            SELECT 'pk' AS tag, kcu.column_name::text, '', '', NULL, kcu.ordinal_position::int
             FROM information_schema.table_constraints tc
             JOIN information_schema.key_column_usage kcu
                 ON tc.constraint_catalog = kcu.constraint_catalog
@@ -59,8 +52,21 @@ def debug_mele_sources():
             WHERE tc.constraint_type = 'PRIMARY KEY'
                 AND tc.table_name = 'mele_sources'
                 AND tc.table_schema = 'public'
+            ORDER BY 1, 6
         """)
-        pk_columns = cur.fetchall()
+        
+        columns = []
+        pk_columns = []
+        for tag, *col in cur.fetchall():
+            if tag == 'col':
+                columns.append(col)
+            else:
+                pk_columns.append(col)
+        
+        print("\n📋 Table Schema:")
+        for col in columns:
+            print(f"   - {col[0]}: {col[1]} {'NULL' if col[2] == 'YES' else 'NOT NULL'} {f'DEFAULT {col[3]}' if col[3] else ''}")
+        
         print(f"\n🔑 Primary Key: {[col[0] for col in pk_columns]}")
         
         # Sample some data to understand the issue
@@ -70,19 +76,26 @@ def debug_mele_sources():
         for row in rows:
             print(f"   ID: {row[0]} ({type(row[0]).__name__}), canonical_mele_id: {row[1]} ({type(row[1]).__name__})")
         
-        # Check if there are any records with the specific ID mentioned in the error
-        cur.execute("SELECT * FROM mele_sources WHERE canonical_mele_id = 'adios_ke_aloha_canonical_source'")
-        problem_row = cur.fetchone()
+        # Probe for the ID mentioned in the error and for the pattern it
+        # follows (ending in _source) together; the exact match sorts first
+        problem_id = 'adios_ke_aloha_canonical_source'
+        cur.execute("""
+            SELECT * FROM mele_sources
+            WHERE canonical_mele_id = %s OR canonical_mele_id LIKE '%%_source'
+            ORDER BY canonical_mele_id = %s DESC
+            LIMIT 5
+        """, (problem_id, problem_id))
+        id_index = [d[0] for d in cur.description].index('canonical_mele_id')
+        source_rows = cur.fetchall()
+        
+        problem_row = next((r for r in source_rows if r[id_index] == problem_id), None)
         if problem_row:
             print(f"\n⚠️  Found problem record: {problem_row}")
         else:
-            print(f"\n✅ No record found with canonical_mele_id = 'adios_ke_aloha_canonical_source'")
+            print(f"\n✅ No record found with canonical_mele_id = '{problem_id}'")
             
-        # Check if there are any records with this pattern (ending in _source)
-        cur.execute("SELECT canonical_mele_id FROM mele_sources WHERE canonical_mele_id LIKE '%_source' LIMIT 5")
-        source_records = cur.fetchall()
-        if source_records:
-            print(f"\n🔍 Found records ending in '_source': {[r[0] for r in source_records]}")
+        if source_rows:
+            print(f"\n🔍 Found records ending in '_source': {[r[id_index] for r in source_rows]}")
         
         conn.close()
         
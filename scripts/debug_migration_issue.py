@@ -2,48 +2,60 @@
 """Debug why the migration is failing"""
 
 import os
-import json
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from database import get_database_url, MeleSources
+from sqlalchemy import create_engine, text
+from database import get_database_url
 
 # Database setup
 DATABASE_URL = get_database_url()
 engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-session = SessionLocal()
-
-# Get the first song that's failing
-source = session.query(MeleSources).filter(MeleSources.id == 'adios_ke_aloha_canonical_source').first()
-
-if source:
-    print(f"Analyzing: {source.id}")
-    
-    verses_data = source.verses_json
-    if isinstance(verses_data, str):
-        verses_data = json.loads(verses_data)
-    
-    verses = verses_data.get('verses', [])
+
+# Unpack the verses in SQL and count each order there, so Python only prints.
+# verses_json may hold the document itself or a JSON string containing it.
+VERSE_ORDERS_QUERY = text("""
+    WITH src AS (
+        SELECT ms.id,
+               CASE WHEN jsonb_typeof(ms.verses_json::jsonb) = 'string'
+                    THEN (ms.verses_json::jsonb #>> '{}')::jsonb
+                    ELSE ms.verses_json::jsonb END AS doc
+        FROM mele_sources ms
+        WHERE ms.id = :source_id
+    )
+    SELECT src.id,
+           v.verse->'id' AS verse_id,
+           v.verse->'type' AS verse_type,
+           v.verse->'number' AS verse_number,
+           COALESCE(v.verse->'order', '1'::jsonb) AS verse_order,
+           COUNT(v.verse) OVER (PARTITION BY COALESCE(v.verse->'order', '1'::jsonb)) AS order_count
+    FROM src
+    LEFT JOIN LATERAL jsonb_array_elements(
+        CASE WHEN jsonb_typeof(src.doc->'verses') = 'array'
+             THEN src.doc->'verses'
+             ELSE '[]'::jsonb END
+    ) WITH ORDINALITY AS v(verse, position) ON TRUE
+    ORDER BY v.position
+""")
+
+with engine.connect() as conn:
+    # Get the first song that's failing
+    rows = conn.execute(VERSE_ORDERS_QUERY, {"source_id": 'adios_ke_aloha_canonical_source'}).fetchall()
+
+if rows:
+    print(f"Analyzing: {rows[0].id}")
+
+    verses = [row for row in rows if row.order_count]
     print(f"Found {len(verses)} verses:")
-    
+
     order_counts = {}
     for verse in verses:
-        verse_order = verse.get('order', 1)
-        if verse_order in order_counts:
-            order_counts[verse_order] += 1
-        else:
-            order_counts[verse_order] = 1
-        
-        print(f"  ID: {verse.get('id')}, Type: {verse.get('type')}, Number: {verse.get('number')}, Order: {verse_order}")
-    
+        order_counts[verse.verse_order] = verse.order_count
+        print(f"  ID: {verse.verse_id}, Type: {verse.verse_type}, Number: {verse.verse_number}, Order: {verse.verse_order}")
+
     print(f"\nOrder frequency:")
     for order, count in sorted(order_counts.items()):
         if count > 1:
             print(f"  ⚠️  Order {order}: {count} verses (CONFLICT!)")
         else:
             print(f"  ✅ Order {order}: {count} verse")
-            
+
 else:
     print("Song not found")
-
-session.close()
\ No newline at end of file
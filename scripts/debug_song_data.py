@@ -1,52 +1,62 @@
 #!/usr/bin/env python3
 
+import io
 import json
-from database import SessionLocal, CanonicalMele, MeleSources, MeleMedia
+import sys
+from sqlalchemy import select
+from database import SessionLocal, CanonicalMele, MeleSources, MeleMedia, load_verses_json
 
 def debug_song_data(song_id="bye_and_bye_hoi_mai_canonical"):
     """Debug song data structure"""
     db = SessionLocal()
+    # Collect the report and write it to stdout in one call
+    out = io.StringIO()
     try:
         # Get canonical song data
         canonical_song = db.query(CanonicalMele).filter(CanonicalMele.canonical_mele_id == song_id).first()
-        print(f"Canonical song: {canonical_song}")
+        print(f"Canonical song: {canonical_song}", file=out)
         if canonical_song:
-            print(f"  Title Hawaiian: {canonical_song.canonical_title_hawaiian}")
-            print(f"  Title English: {canonical_song.canonical_title_english}")
+            print(f"  Title Hawaiian: {canonical_song.canonical_title_hawaiian}", file=out)
+            print(f"  Title English: {canonical_song.canonical_title_english}", file=out)
         
         # Get related source data
-        source_data = db.query(MeleSources).filter(MeleSources.canonical_mele_id == song_id).first()
-        print(f"\nSource data: {source_data}")
+        # Read just the columns shown below rather than a mapped instance
+        source_data = db.execute(
+            select(MeleSources.id, MeleSources.canonical_mele_id, MeleSources.verses_json)
+            .where(MeleSources.canonical_mele_id == song_id)
+            .limit(1)
+        ).one_or_none()
+        print(f"\nSource data: {f'Source for {source_data.canonical_mele_id}' if source_data else None}", file=out)
         if source_data:
-            print(f"  Source ID: {source_data.id}")
-            print(f"  Verses JSON exists: {source_data.verses_json is not None}")
+            print(f"  Source ID: {source_data.id}", file=out)
+            print(f"  Verses JSON exists: {source_data.verses_json is not None}", file=out)
             if source_data.verses_json:
-                print(f"  Verses JSON type: {type(source_data.verses_json)}")
+                print(f"  Verses JSON type: {type(source_data.verses_json)}", file=out)
                 # Parse the JSON string
                 try:
-                    verses_data = json.loads(source_data.verses_json)
-                    print(f"  Parsed verses data type: {type(verses_data)}")
+                    verses_data = load_verses_json(source_data.verses_json)
+                    print(f"  Parsed verses data type: {type(verses_data)}", file=out)
                     if isinstance(verses_data, dict):
-                        print(f"  Parsed verses data keys: {verses_data.keys()}")
+                        print(f"  Parsed verses data keys: {verses_data.keys()}", file=out)
                         if 'verses' in verses_data:
                             verses = verses_data['verses']
-                            print(f"  Number of verses: {len(verses) if isinstance(verses, list) else 'Not a list'}")
+                            print(f"  Number of verses: {len(verses) if isinstance(verses, list) else 'Not a list'}", file=out)
                             if isinstance(verses, list) and len(verses) > 0:
-                                print(f"  First verse keys: {verses[0].keys()}")
-                                print(f"  First verse: {verses[0]}")
+                                print(f"  First verse keys: {verses[0].keys()}", file=out)
+                                print(f"  First verse: {verses[0]}", file=out)
                     elif isinstance(verses_data, list):
-                        print(f"  Verses data is a list with {len(verses_data)} items")
+                        print(f"  Verses data is a list with {len(verses_data)} items", file=out)
                         if len(verses_data) > 0:
-                            print(f"  First item type: {type(verses_data[0])}")
-                            print(f"  First item keys: {verses_data[0].keys() if isinstance(verses_data[0], dict) else 'Not a dict'}")
-                            print(f"  First item: {verses_data[0]}")
+                            print(f"  First item type: {type(verses_data[0])}", file=out)
+                            print(f"  First item keys: {verses_data[0].keys() if isinstance(verses_data[0], dict) else 'Not a dict'}", file=out)
+                            print(f"  First item: {verses_data[0]}", file=out)
                 except json.JSONDecodeError as e:
-                    print(f"  JSON parse error: {e}")
-                    print(f"  Raw data (first 200 chars): {source_data.verses_json[:200]}...")
+                    print(f"  JSON parse error: {e}", file=out)
+                    print(f"  Raw data (first 200 chars): {source_data.verses_json[:200]}...", file=out)
         
         # Get related media data
         media_data = db.query(MeleMedia).filter(MeleMedia.canonical_mele_id == song_id).all()
-        print(f"\nMedia data count: {len(media_data)}")
+        print(f"\nMedia data count: {len(media_data)}", file=out)
         
         return {
             "canonical_song": canonical_song,
@@ -55,6 +65,7 @@ def debug_song_data(song_id="bye_and_bye_hoi_mai_canonical"):
         }
     finally:
         db.close()
+        sys.stdout.write(out.getvalue())
 
 if __name__ == "__main__":
     debug_song_data()
\ No newline at end of file
@@ -14,8 +14,17 @@ from auth import get_database_url
 # Database connection
 DB_URL = get_database_url()
 
+# Reused across calls so repeated runs from a REPL keep the same pool
+_ENGINE = None
+
+def _engine():
+    global _ENGINE
+    if _ENGINE is None:
+        _ENGINE = create_engine(DB_URL, pool_size=2, pool_pre_ping=True)
+    return _ENGINE
+
 def investigate_verse_structure():
-    engine = create_engine(DB_URL)
+    engine = _engine()
     
     with engine.connect() as conn:
         # Get a few songs with verses_json data
@@ -7,26 +7,39 @@ Identifies table structures, extracts titles/composers, and parses verses/chorus
 """
 
 import re
+import html
 import json
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
 from bs4 import BeautifulSoup
+from bs4.element import NavigableString, PreformattedString, Tag
 from datetime import datetime
 
-@dataclass
+# Parse with libxml2 when lxml is installed; html.parser otherwise
+try:
+    import lxml  # noqa: F401
+    SOUP_FEATURES = 'lxml'
+except ImportError:
+    SOUP_FEATURES = 'html.parser'
+
+@dataclass(slots=True)
 class SongLine:
     hawaiian_text: str = ""
     english_text: str = ""
     line_number: int = 0
     
-@dataclass
+@dataclass(slots=True)
 class SongSection:
     section_type: str = "verse"  # verse, chorus, hui
     number: int = 1
     lines: List[SongLine] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class ParsedSong:
     title: str = ""
     composer: str = ""
@@ -34,48 +47,103 @@ class ParsedSong:
     source_info: str = ""
     sections: List[SongSection] = field(default_factory=list)
 
+# Lowercase prefixes marking section header lines
+HEADER_PREFIXES = ('hui:', 'chorus:', 'verse', 'bridge:', 'outro:')
+
+@lru_cache(maxsize=1024)
+def _is_header_text(line: str) -> bool:
+    """Cached header test; the same few header lines recur in every song"""
+    return line.lstrip().lower().startswith(HEADER_PREFIXES)
+
+def _clean_sub(match) -> str:
+    """Replacement for EnhancedHuapalaParser._clean_re"""
+    return ' ' if match.lastgroup == 'ws' else ''
+
 class EnhancedHuapalaParser:
     """Enhanced parser that handles raw HTML files directly"""
     
+    # Entries kept by the _clean_text cache before it is reset
+    CLEAN_CACHE_SIZE = 4096
+    
     def __init__(self):
-        self.title_patterns = [
+        # Results of _clean_text, which sees the same short strings repeatedly
+        self._clean_cache = {}
+        
+        # Patterns are compiled once here and reused for every file. Captures
+        # use greedy negated classes: the class already stops at the
+        # terminator, so a lazy quantifier only adds retries (the extra
+        # trailing whitespace it may keep is stripped by the callers)
+        self.title_patterns = [re.compile(p, re.IGNORECASE) for p in (
             r'<font[^>]*size="3"[^>]*>([^<]+)</font>',
             r'<title>([^<]+)</title>',
             r'<h1[^>]*>([^<]+)</h1>',
             r'<h2[^>]*>([^<]+)</h2>'
-        ]
+        )]
         
-        self.composer_patterns = [
-            r'(?:-\s*)?(?:music\s+by|composed\s+by|by)\s+([^<\n\r]+?)(?:\s*<|$)',
-            r'(?:lyrics?\s+by\s+[^,]+,?\s*)?music\s+by\s+([^<\n\r]+?)(?:\s*<|$)',
-            r'Words\s+by\s+[^,]+,?\s*(?:music\s+)?by\s+([^<\n\r]+?)(?:\s*<|$)',
+        # Tried in order, first match wins. "music by X" and "Words by ...,
+        # music by X" need no patterns of their own: the plain "by" pattern
+        # matches wherever they would, so they could never be reached.
+        self.composer_patterns = [re.compile(p, re.IGNORECASE) for p in (
+            r'(?:-\s*)?(?:music\s+by|composed\s+by|by)\s+([^<\n\r]+)(?:\s*<|$)',
             r'<font[^>]*>([^<]+)</font>\s*(?:-|\u2013)',
-            r'-\s*([^<\n\r]+?)(?:\s*<br|$)'
-        ]
-        
-        self.translator_patterns = [
-            r'(?:translated\s+by|translation\s+by)\s+([^<\n\r]+?)(?:\s*<|$)',
-            r'(?:Hawaiian\s+)?[Tt]ext\s+edited\s+by\s+([^<\n\r]+?)(?:\s*<|$)'
-        ]
+            r'-\s*([^<\n\r]+)(?:\s*<br|$)'
+        )]
+        
+        self.translator_patterns = [re.compile(p, re.IGNORECASE) for p in (
+            r'(?:translated\s+by|translation\s+by)\s+([^<\n\r]+)(?:\s*<|$)',
+            r'(?:Hawaiian\s+)?[Tt]ext\s+edited\s+by\s+([^<\n\r]+)(?:\s*<|$)'
+        )]
+        
+        # Fast path for the usual layout: a <center> holding the title in a
+        # <font size="3"> plus the attribution text. Group 1 is the center's
+        # inner HTML, group 2 whatever precedes the font, group 3 the title.
+        self._center_open_re = re.compile(r'<center\b', re.IGNORECASE)
+        # One whole attribute, so size="3" is never read out of another's value
+        font_attr = r'''\s+[\w-]+(?:\s*=\s*(?:"[^"]*"|'[^']*'|[^\s>"']+))?'''
+        self._title_center_re = re.compile(
+            r'<center\b[^>]*>(((?:(?!</center>).)*?)'
+            r'<font(?:' + font_attr + r')*?\s+size="3"(?:' + font_attr + r')*\s*>([^<]+)</font>'
+            r'(?:(?!</center>).)*?)</center>',
+            re.IGNORECASE | re.DOTALL
+        )
+        self._any_tag_re = re.compile(r'<[^>]*>')
+        
+        # Phrases marking a table row as source/attribution info
+        self._source_re = re.compile(
+            r'source:|recorded by|copyright|composed|mana collection|pandanus club',
+            re.IGNORECASE
+        )
+        
+        # Cleanup patterns used by the line splitter
+        self._line_split_re = re.compile(r'\n|<br\s*/?>', re.IGNORECASE)
+        # HTML whitespace inside a text node renders as one space, so a
+        # soft-wrapped source line stays one line; only <br> breaks it
+        self._html_ws_re = re.compile(r'[ \t\r\n\f]+')
+        # Entities are dropped and whitespace runs collapsed in one pass; a
+        # run of entities and whitespace becomes a single space if it holds
+        # any whitespace, otherwise nothing
+        self._clean_re = re.compile(r'(?P<ws>(?:&[a-zA-Z0-9]+;)*\s(?:\s|&[a-zA-Z0-9]+;)*)|&[a-zA-Z0-9]+;')
         
     def parse_file(self, file_path: str) -> Tuple[ParsedSong, dict]:
         """Parse a raw HTML file and extract song data"""
         
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            html_content = f.read()
+        html_content = self._read_source(file_path)
         
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, SOUP_FEATURES)
         song = ParsedSong()
         
         # Extract title and composer
         song.title, song.composer = self._extract_title_and_composer(html_content, soup)
         song.translator = self._extract_translator(html_content)
-        song.source_info = self._extract_source_info(soup)
+        
+        # Walk the tables once; source and lyrics lookups share the rows
+        tables = [(table, table.find_all('tr')) for table in soup.find_all('table')]
+        song.source_info = self._extract_source_info(tables)
         
         # Find and parse the main lyrics table
-        lyrics_table = self._find_lyrics_table(soup)
-        if lyrics_table:
-            song.sections = self._parse_lyrics_table(lyrics_table)
+        lyrics_cells = self._find_lyrics_table(tables)
+        if lyrics_cells:
+            song.sections = self._parse_lyrics_table(lyrics_cells)
         else:
             # Fallback: try to find lyrics in any table or div structure
             song.sections = self._parse_alternative_structure(soup)
@@ -85,11 +153,45 @@ class EnhancedHuapalaParser:
         
         return song, validation_result
     
+    def _read_source(self, file_path: str) -> str:
+        """Read a source file through a read-only mmap and decode it once"""
+        with open(file_path, 'rb') as f:
+            # mmap cannot map an empty file
+            if os.fstat(f.fileno()).st_size == 0:
+                return ""
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                text = str(mm[:], 'utf-8', errors='ignore')
+        # Match text-mode reading, which translated line endings
+        return text.replace('\r\n', '\n').replace('\r', '\n')
+    
     def _extract_title_and_composer(self, html_content: str, soup: BeautifulSoup) -> Tuple[str, str]:
         """Extract song title and composer from HTML"""
         title = ""
         composer = ""
         
+        # Try the common layout on the raw HTML before walking the tree. It
+        # only stands in for the walk below when the title font is the first
+        # font of the first <center>, with no comment or nested center that
+        # the parsed tree would see differently; anything else falls through.
+        match = None
+        first_center = self._center_open_re.search(html_content)
+        if first_center:
+            match = self._title_center_re.match(html_content, first_center.start())
+        if (match
+                and '<font' not in match.group(2).lower()
+                and '<center' not in match.group(1).lower()
+                and '<!--' not in match.group(1)
+                and not self._inside_comment(html_content, match.start())):
+            title_text = html.unescape(match.group(3)).strip()
+            if len(title_text) > 2:
+                full_text = self._fragment_text(match.group(1))
+                for pattern in self.composer_patterns:
+                    composer_match = pattern.search(full_text)
+                    if composer_match:
+                        composer = composer_match.group(1).strip()
+                        break
+                return self._clean_text(title_text), self._clean_text(composer)
+        
         # Look for title in center tags or font size="3"
         center_tags = soup.find_all('center')
         for center in center_tags:
@@ -106,7 +208,7 @@ class EnhancedHuapalaParser:
                     
                     # Try to extract composer from the full text
                     for pattern in self.composer_patterns:
-                        match = re.search(pattern, full_text, re.IGNORECASE)
+                        match = pattern.search(full_text)
                         if match:
                             composer = match.group(1).strip()
                             break
@@ -125,84 +227,87 @@ class EnhancedHuapalaParser:
         
         return title, composer
     
+    @staticmethod
+    def _inside_comment(html_content: str, position: int) -> bool:
+        """Whether position falls inside an HTML comment opened before it"""
+        comment_start = html_content.rfind('<!--', 0, position)
+        return comment_start != -1 and html_content.find('-->', comment_start + 4, position) == -1
+    
+    def _fragment_text(self, fragment: str) -> str:
+        """Text of an HTML fragment, like get_text(separator=' ', strip=True)"""
+        pieces = (html.unescape(piece).strip() for piece in self._any_tag_re.split(fragment))
+        return ' '.join(piece for piece in pieces if piece)
+    
     def _extract_translator(self, html_content: str) -> str:
         """Extract translator information"""
         for pattern in self.translator_patterns:
-            match = re.search(pattern, html_content, re.IGNORECASE)
+            match = pattern.search(html_content)
             if match:
                 return self._clean_text(match.group(1))
         return ""
     
-    def _extract_source_info(self, soup: BeautifulSoup) -> str:
+    def _extract_source_info(self, tables: List[tuple]) -> str:
         """Extract source information from the bottom of the page"""
         # Look for source info in the last table row or at the bottom
-        source_patterns = [
-            'source:',
-            'recorded by',
-            'copyright',
-            'composed',
-            'mana collection',
-            'pandanus club'
-        ]
-        
-        # Check last table rows
-        tables = soup.find_all('table')
-        for table in tables:
-            rows = table.find_all('tr')
+        for _, rows in tables:
             if len(rows) >= 2:  # Check last row
-                last_row = rows[-1]
-                text = last_row.get_text(separator=' ', strip=True).lower()
-                if any(pattern in text for pattern in source_patterns):
-                    return self._clean_text(last_row.get_text(separator=' ', strip=True))
+                text = rows[-1].get_text(separator=' ', strip=True)
+                if self._source_re.search(text):
+                    return self._clean_text(text)
         
         return ""
     
-    def _find_lyrics_table(self, soup: BeautifulSoup) -> Optional:
-        """Find the main table containing lyrics in 2-column format"""
-        tables = soup.find_all('table')
-        
-        for table in tables:
-            rows = table.find_all('tr')
-            
+    def _find_lyrics_table(self, tables: List[tuple]) -> Optional[List[tuple]]:
+        """Find the main table containing lyrics in 2-column format
+        
+        Takes (table, rows) for each table in the page. Returns the (Hawaiian,
+        English) cell pairs of the lyrics table's content rows, or None. Each
+        row's text is read once and shared by both checks.
+        """
+        for table, rows in tables:
             # Look for a table with at least 2 rows and 2 columns
             if len(rows) < 2:
                 continue
-                
-            # Check if any row has 2 cells with substantial text content
+            
+            # A lyrics row needs a <br> in each of its cells, so a table with
+            # fewer than two can be skipped without inspecting its rows
+            if len(table.find_all('br', limit=2)) < 2:
+                continue
+            
+            cell_pairs = []
+            is_lyrics_table = False
             for row in rows:
+                # Cheapest checks first: skip header rows, rows without 2
+                # columns and rows that are clearly metadata (too short)
                 cells = row.find_all(['td', 'th'])
-                if len(cells) == 2:
-                    cell1_text = cells[0].get_text(strip=True)
-                    cell2_text = cells[1].get_text(strip=True)
-                    
-                    # If both cells have Hawaiian/English text (substantial content)
-                    if (len(cell1_text) > 20 and len(cell2_text) > 20 and
-                        '<br>' in str(cells[0]) and '<br>' in str(cells[1])):
-                        return table
+                if len(cells) != 2:
+                    continue
+                cell1_text = cells[0].get_text(strip=True)
+                if len(cell1_text) < 20:
+                    continue
+                cell2_text = cells[1].get_text(strip=True)
+                if len(cell2_text) < 20:
+                    continue
+                
+                cell_pairs.append((cells[0], cells[1]))
+                
+                # If both cells have Hawaiian/English text (substantial content)
+                if (not is_lyrics_table and len(cell1_text) > 20 and len(cell2_text) > 20 and
+                        cells[0].find('br') is not None and cells[1].find('br') is not None):
+                    is_lyrics_table = True
+            
+            if is_lyrics_table:
+                return cell_pairs
         
         return None
     
-    def _parse_lyrics_table(self, table) -> List[SongSection]:
-        """Parse the main lyrics table into sections"""
-        rows = table.find_all('tr')
+    def _parse_lyrics_table(self, cell_pairs: List[tuple]) -> List[SongSection]:
+        """Parse the lyrics table's (Hawaiian, English) cell pairs into sections"""
         sections = []
         
-        for row in rows:
-            cells = row.find_all(['td', 'th'])
-            
-            # Skip header rows or rows without 2 columns
-            if len(cells) != 2:
-                continue
-                
-            # Skip rows that are clearly metadata (too short)
-            cell1_text = cells[0].get_text(strip=True)
-            cell2_text = cells[1].get_text(strip=True)
-            
-            if len(cell1_text) < 20 or len(cell2_text) < 20:
-                continue
-            
+        for hawaiian_cell, english_cell in cell_pairs:
             # Parse this row as lyrics content
-            section_data = self._parse_lyrics_cells(cells[0], cells[1])
+            section_data = self._parse_lyrics_cells(hawaiian_cell, english_cell)
             if section_data:
                 sections.extend(section_data)
         
@@ -211,15 +316,12 @@ class EnhancedHuapalaParser:
     def _parse_lyrics_cells(self, hawaiian_cell, english_cell) -> List[SongSection]:
         """Parse Hawaiian and English cells into song sections"""
         
-        # Get HTML content to preserve <br> tags
-        hawaiian_html = str(hawaiian_cell)
-        english_html = str(english_cell)
-        
         # Split by paragraph breaks and <br> tags
-        hawaiian_blocks = self._split_into_blocks(hawaiian_html)
-        english_blocks = self._split_into_blocks(english_html)
+        hawaiian_blocks = self._split_into_blocks(hawaiian_cell)
+        english_blocks = self._split_into_blocks(english_cell)
         
         sections = []
+        verse_count = 0
         
         # Process each block as a potential section
         max_blocks = max(len(hawaiian_blocks), len(english_blocks))
@@ -233,11 +335,11 @@ class EnhancedHuapalaParser:
             
             # Determine section type
             section_type = "verse"
-            section_number = len([s for s in sections if s.section_type == "verse"]) + 1
+            section_number = verse_count + 1
             
             # Check for chorus indicators
-            if ("hui:" in h_block.lower() or "chorus:" in e_block.lower() or
-                any(indicator in h_block.lower() for indicator in ["hui:", "chorus"])):
+            h_lower = h_block.lower()
+            if "hui:" in h_lower or "chorus" in h_lower or "chorus:" in e_block.lower():
                 section_type = "chorus"
                 section_number = 1
             
@@ -270,32 +372,75 @@ class EnhancedHuapalaParser:
             
             if section.lines:  # Only add sections with content
                 sections.append(section)
+                if section_type == "verse":
+                    verse_count += 1
         
         return sections
     
-    def _split_into_blocks(self, html_content: str) -> List[str]:
-        """Split HTML content into logical blocks (verses/chorus)"""
-        
-        # Remove HTML tags but keep <br> as markers
-        html_content = re.sub(r'<(?!br\s*/?>)[^>]+>', ' ', html_content)
-        
-        # Split on double <br> or <p> tags (verse separators)
-        blocks = re.split(r'<br\s*/?>[\s\n]*<br\s*/?>|<p[^>]*>|</p>', html_content, flags=re.IGNORECASE)
-        
-        # Clean up blocks
-        cleaned_blocks = []
-        for block in blocks:
-            block = re.sub(r'<br\s*/?>', '\n', block, flags=re.IGNORECASE)
-            block = self._clean_text(block)
-            if block.strip():
-                cleaned_blocks.append(block)
-        
-        return cleaned_blocks
+    def _split_into_blocks(self, cell: Tag) -> List[str]:
+        """Split a table cell into logical blocks (verses/chorus)
+        
+        Walks the cell's tree directly: a double <br> or a <p> boundary ends
+        a block, a single <br> ends a line, and other tags count as a space.
+        Whitespace in text, newlines included, collapses to one space as a
+        browser renders it. Each block is returned as its lines joined with
+        newlines.
+        """
+        blocks = []
+        lines = []
+        line = []
+        block_has_text = False
+        after_br = False
+        collapse_ws = self._html_ws_re.sub
+        
+        def end_line():
+            lines.append(''.join(line))
+            line.clear()
+        
+        def end_block():
+            nonlocal block_has_text
+            end_line()
+            if block_has_text:
+                blocks.append('\n'.join(lines))
+                block_has_text = False
+            lines.clear()
+        
+        def walk(node):
+            nonlocal after_br, block_has_text
+            for child in node.children:
+                if isinstance(child, Tag):
+                    if child.name == 'br':
+                        # Any text since the last <br> would have reset
+                        # after_br, so this is a double break
+                        if after_br:
+                            end_block()
+                            after_br = False
+                        else:
+                            end_line()
+                            after_br = True
+                    elif child.name == 'p':
+                        end_block()
+                        walk(child)
+                        end_block()
+                    else:
+                        line.append(' ')
+                        walk(child)
+                        line.append(' ')
+                elif isinstance(child, NavigableString) and not isinstance(child, PreformattedString):
+                    line.append(collapse_ws(' ', child))
+                    if child and not child.isspace():
+                        after_br = False
+                        block_has_text = True
+        
+        walk(cell)
+        end_block()
+        
+        return blocks
     
     def _extract_lines(self, block_text: str) -> List[str]:
         """Extract individual lines from a text block"""
         # Split on line breaks
-        lines = re.split(r'\n|<br\s*/?>', block_text, flags=re.IGNORECASE)
+        lines = self._line_split_re.split(block_text)
         
         # Clean and filter lines
         cleaned_lines = []
@@ -308,25 +453,25 @@ class EnhancedHuapalaParser:
     
     def _is_header_line(self, line: str) -> bool:
         """Check if a line is a header (Hui:, Chorus:, etc.) rather than lyrics"""
-        line_lower = line.lower().strip()
-        headers = ['hui:', 'chorus:', 'verse', 'bridge:', 'outro:']
-        return any(line_lower.startswith(header) for header in headers)
+        return _is_header_text(line)
     
     def _clean_text(self, text: str) -> str:
         """Clean extracted text"""
         if not text:
             return ""
         
-        # Remove HTML entities and extra whitespace
-        text = re.sub(r'&[a-zA-Z0-9]+;', '', text)
-        text = re.sub(r'\s+', ' ', text)
-        text = text.strip()
-        
-        # Remove common artifacts
-        text = re.sub(r'^[-\s]*', '', text)  # Leading dashes
-        text = re.sub(r'[\s]*$', '', text)   # Trailing spaces
-        
-        return text
+        cached = self._clean_cache.get(text)
+        if cached is not None:
+            return cached
+        if len(self._clean_cache) >= self.CLEAN_CACHE_SIZE:
+            self._clean_cache.clear()
+        
+        # Remove HTML entities and extra whitespace; only single spaces are
+        # left afterwards, so leading dashes and trailing spaces can go with
+        # plain strips
+        cleaned = self._clean_re.sub(_clean_sub, text).lstrip('- ').rstrip(' ')
+        self._clean_cache[text] = cleaned
+        return cleaned
     
     def _parse_alternative_structure(self, soup: BeautifulSoup) -> List[SongSection]:
         """Fallback parser for non-standard structures"""
@@ -334,9 +479,19 @@ class EnhancedHuapalaParser:
         # additional parsing strategies here
         return []
     
+    @staticmethod
+    def _section_totals(sections: List[SongSection]) -> Tuple[int, bool]:
+        """Total line count and whether any section is a chorus, in one pass"""
+        total_lines = 0
+        has_chorus = False
+        for section in sections:
+            total_lines += len(section.lines)
+            has_chorus = has_chorus or section.section_type == "chorus"
+        return total_lines, has_chorus
+    
     def _generate_validation_result(self, song: ParsedSong) -> dict:
         """Generate validation metadata"""
-        total_lines = sum(len(section.lines) for section in song.sections)
+        total_lines, has_chorus = self._section_totals(song.sections)
         
         # Simple quality score based on completeness
         quality_score = 0
@@ -344,13 +499,13 @@ class EnhancedHuapalaParser:
         if song.composer: quality_score += 20
         if song.sections: quality_score += 30
         if total_lines > 5: quality_score += 20
-        if any(section.section_type == "chorus" for section in song.sections): quality_score += 10
+        if has_chorus: quality_score += 10
         
         return {
             "quality_score": quality_score,
             "total_sections": len(song.sections),
             "total_lines": total_lines,
-            "has_chorus": any(section.section_type == "chorus" for section in song.sections),
+            "has_chorus": has_chorus,
             "parsing_method": "enhanced_html_parser",
             "timestamp": datetime.now().isoformat()
         }
@@ -358,67 +513,92 @@ class EnhancedHuapalaParser:
     def generate_jsonb_structure(self, song: ParsedSong) -> dict:
         """Generate the JSONB structure for database storage"""
         sections = []
-        
-        for i, section in enumerate(song.sections):
-            section_data = {
-                "id": f"{section.section_type[0]}{section.number}",
-                "type": section.section_type,
-                "number": section.number,
-                "order": i + 1,
-                "lines": []
-            }
-            
-            for j, line in enumerate(section.lines):
-                line_data = {
-                    "id": f"{section_data['id']}.{j+1}",
-                    "line_number": j + 1,
+        total_lines = 0
+        has_chorus = False
+        
+        # Build each section's lines in a comprehension and gather the
+        # metadata totals in the same pass
+        for i, section in enumerate(song.sections, 1):
+            section_id = f"{section.section_type[0]}{section.number}"
+            lines = [
+                {
+                    "id": f"{section_id}.{j}",
+                    "line_number": j,
                     "hawaiian_text": line.hawaiian_text,
                     "english_text": line.english_text,
                     "is_bilingual": bool(line.hawaiian_text and line.english_text)
                 }
-                section_data["lines"].append(line_data)
+                for j, line in enumerate(section.lines, 1)
+            ]
+            total_lines += len(lines)
+            has_chorus = has_chorus or section.section_type == "chorus"
             
-            sections.append(section_data)
+            sections.append({
+                "id": section_id,
+                "type": section.section_type,
+                "number": section.number,
+                "order": i,
+                "lines": lines
+            })
         
         return {
             "sections": sections,
             "metadata": {
                 "total_sections": len(sections),
-                "total_lines": sum(len(section["lines"]) for section in sections),
-                "has_chorus": any(section["type"] == "chorus" for section in sections),
+                "total_lines": total_lines,
+                "has_chorus": has_chorus,
                 "last_updated": datetime.now().isoformat()
             }
         }
 
+# One parser per worker process, so patterns are compiled once per process
+_worker_parser = None
+
+def _parse_one(file_path: str):
+    """Parse a file in a worker process, returning the error instead of raising"""
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = EnhancedHuapalaParser()
+    try:
+        return _worker_parser.parse_file(file_path), None
+    except Exception as e:
+        return None, e
+
+def parse_files(file_paths: List[str], max_workers: Optional[int] = None) -> List[tuple]:
+    """Parse files in parallel worker processes
+    
+    Returns ((song, validation), error) per file, in input order.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_parse_one, file_paths, chunksize=8))
+
 def test_parser():
     """Test the enhanced parser on sample files"""
-    parser = EnhancedHuapalaParser()
-    
     test_files = [
         "data/source_html/E Waianae.txt",
         "data/source_html/Pili Mau Me Oe.txt"
     ]
+    test_files = [file_path for file_path in test_files if Path(file_path).exists()]
     
-    for file_path in test_files:
-        if Path(file_path).exists():
-            print(f"\n🔍 Testing: {file_path}")
-            try:
-                song, validation = parser.parse_file(file_path)
-                print(f"   Title: {song.title}")
-                print(f"   Composer: {song.composer}")
-                print(f"   Sections: {len(song.sections)}")
-                print(f"   Quality Score: {validation.get('quality_score', 0)}")
-                
-                # Show first few lines
-                if song.sections:
-                    first_section = song.sections[0]
-                    print(f"   First section ({first_section.section_type}):")
-                    for line in first_section.lines[:2]:
-                        print(f"     H: {line.hawaiian_text[:50]}...")
-                        print(f"     E: {line.english_text[:50]}...")
-                
-            except Exception as e:
-                print(f"   ❌ Error: {e}")
+    for file_path, (parsed, error) in zip(test_files, parse_files(test_files)):
+        print(f"\n🔍 Testing: {file_path}")
+        if error is not None:
+            print(f"   ❌ Error: {error}")
+            continue
+        
+        song, validation = parsed
+        print(f"   Title: {song.title}")
+        print(f"   Composer: {song.composer}")
+        print(f"   Sections: {len(song.sections)}")
+        print(f"   Quality Score: {validation.get('quality_score', 0)}")
+        
+        # Show first few lines
+        if song.sections:
+            first_section = song.sections[0]
+            print(f"   First section ({first_section.section_type}):")
+            for line in first_section.lines[:2]:
+                print(f"     H: {line.hawaiian_text[:50]}...")
+                print(f"     E: {line.english_text[:50]}...")
 
 if __name__ == "__main__":
     test_parser()
\ No newline at end of file
@@ -21,15 +21,64 @@ DB_CONFIG = {
     'sslmode': 'require'
 }
 
+# Song rows fetched per round trip while streaming the export
+EXPORT_FETCH_SIZE = 200
+
 def export_songs_data():
     """Export all song data to JSON for web interface"""
     
     conn = psycopg2.connect(**DB_CONFIG)
-    cur = conn.cursor(cursor_factory=RealDictCursor)
     
-    try:
-        # Query to get all song data with related information
-        query = """
+    # Query to get all song data with related information. Each song's
+    # verses, taken from one source per canonical mele and ordered, are
+    # built into a JSON array in the database and joined on after the
+    # song grouping, so every row arrives complete and nothing has to be
+    # held in memory across rows.
+    query = """
+    WITH sources AS (
+        SELECT DISTINCT ON (canonical_mele_id) id, canonical_mele_id
+        FROM mele_sources
+        ORDER BY canonical_mele_id, id
+    ),
+    verse_rows AS (
+        SELECT 
+            s.canonical_mele_id,
+            v.verse_order,
+            v.verse_id,
+            v.verse_type,
+            v.verse_number,
+            v.label,
+            JSON_AGG(
+                JSON_BUILD_OBJECT(
+                    'id', vl.line_id,
+                    'line_number', vl.line_number,
+                    'hawaiian_text', vl.hawaiian_text,
+                    'english_text', vl.english_text,
+                    'is_bilingual', vl.is_bilingual
+                ) ORDER BY vl.line_number
+            ) as lines
+        FROM sources s
+        JOIN verses v ON v.mele_source_id = s.id
+        LEFT JOIN verse_lines vl ON v.id = vl.verse_id
+        GROUP BY s.canonical_mele_id, v.id, v.verse_id, v.verse_type, v.verse_number, v.verse_order, v.label
+    ),
+    song_verses AS (
+        SELECT 
+            canonical_mele_id,
+            JSON_AGG(
+                -- label only when present
+                CASE WHEN COALESCE(label, '') = '' THEN
+                    JSON_BUILD_OBJECT('id', verse_id, 'type', verse_type, 'number', verse_number,
+                                      'order', verse_order, 'lines', lines)
+                ELSE
+                    JSON_BUILD_OBJECT('id', verse_id, 'type', verse_type, 'number', verse_number,
+                                      'order', verse_order, 'lines', lines, 'label', label)
+                END ORDER BY verse_order
+            ) as verses
+        FROM verse_rows
+        GROUP BY canonical_mele_id
+    ),
+    songs AS (
         SELECT 
             cm.canonical_mele_id,
             cm.canonical_title_hawaiian,
@@ -60,101 +109,62 @@ def export_songs_data():
             cm.cultural_significance_notes, ms.composer, ms.translator, ms.hawaiian_editor,
             ms.source_file, ms.source_publication, ms.copyright_info,
             ms.primary_location, ms.island, ms.themes, ms.mele_type, ms.cultural_elements
-        ORDER BY cm.canonical_title_hawaiian
-        """
+    )
+    SELECT songs.*, COALESCE(sv.verses, '[]'::json) as verses
+    FROM songs
+    LEFT JOIN song_verses sv ON sv.canonical_mele_id = songs.canonical_mele_id
+    ORDER BY songs.canonical_title_hawaiian
+    """
+    
+    # Written beside the real file and renamed over it at the end, so a
+    # failed export never leaves a truncated file on the published site
+    output_file = 'docs/songs-data.json'
+    temp_file = output_file + '.tmp'
+    
+    try:
+        # Stream song rows from a server-side cursor and write each one as it
+        # arrives, so memory does not grow with the corpus
+        song_cur = conn.cursor(name='song_export', cursor_factory=RealDictCursor)
+        song_cur.itersize = EXPORT_FETCH_SIZE
+        song_cur.execute(query)
         
-        cur.execute(query)
-        rows = cur.fetchall()
+        titles = []
         
-        # Convert to list of dictionaries and process
-        songs_data = []
-        for row in rows:
-            song = dict(row)
-            
-            # Get the source ID for this canonical mele
-            source_id_query = """
-            SELECT id FROM mele_sources WHERE canonical_mele_id = %s
-            """
-            cur.execute(source_id_query, (song['canonical_mele_id'],))
-            source_result = cur.fetchone()
-            
-            if source_result:
-                source_id = source_result['id']
-                
-                # Get verses from normalized tables
-                verses_query = """
-                SELECT 
-                    v.verse_id,
-                    v.verse_type,
-                    v.verse_number,
-                    v.verse_order,
-                    v.label,
-                    JSON_AGG(
-                        JSON_BUILD_OBJECT(
-                            'id', vl.line_id,
-                            'line_number', vl.line_number,
-                            'hawaiian_text', vl.hawaiian_text,
-                            'english_text', vl.english_text,
-                            'is_bilingual', vl.is_bilingual
-                        ) ORDER BY vl.line_number
-                    ) as lines
-                FROM verses v
-                LEFT JOIN verse_lines vl ON v.id = vl.verse_id
-                WHERE v.mele_source_id = %s
-                GROUP BY v.id, v.verse_id, v.verse_type, v.verse_number, v.verse_order, v.label
-                ORDER BY v.verse_order
-                """
-                
-                cur.execute(verses_query, (source_id,))
-                verses_rows = cur.fetchall()
-            else:
-                # No source found, set empty verses
-                verses_rows = []
-            
-            # Build verses structure
-            verses = []
-            for verse_row in verses_rows:
-                verse_data = {
-                    'id': verse_row['verse_id'],
-                    'type': verse_row['verse_type'],
-                    'number': verse_row['verse_number'],
-                    'order': verse_row['verse_order'],
-                    'lines': verse_row['lines'] or []
-                }
+        # Write to JSON file for web interface; compact, since the file is
+        # only read by the browser and indenting dominates encoder time
+        with song_cur, open(temp_file, 'w', encoding='utf-8') as f:
+            f.write('[')
+            for row in song_cur:
+                song = dict(row)
                 
-                # Add label if present
-                if verse_row['label']:
-                    verse_data['label'] = verse_row['label']
+                # Clean up None values and empty arrays
+                if song['youtube_urls'] and song['youtube_urls'][0] is None:
+                    song['youtube_urls'] = []
+                elif not song['youtube_urls']:
+                    song['youtube_urls'] = []
                     
-                verses.append(verse_data)
-            
-            song['verses'] = verses
-            
-            # Clean up None values and empty arrays
-            if song['youtube_urls'] and song['youtube_urls'][0] is None:
-                song['youtube_urls'] = []
-            elif not song['youtube_urls']:
-                song['youtube_urls'] = []
+                if song['youtube_count'] == 0:
+                    song['youtube_count'] = None
                 
-            if song['youtube_count'] == 0:
-                song['youtube_count'] = None
-            
-            songs_data.append(song)
+                if titles:
+                    f.write(',')
+                json.dump(song, f, separators=(',', ':'), ensure_ascii=False, default=str)
+                titles.append(song['canonical_title_hawaiian'])
+            f.write(']')
         
-        # Write to JSON file for web interface
-        with open('docs/songs-data.json', 'w', encoding='utf-8') as f:
-            json.dump(songs_data, f, indent=2, ensure_ascii=False, default=str)
+        os.replace(temp_file, output_file)
         
-        print(f"Exported {len(songs_data)} songs to docs/songs-data.json")
+        print(f"Exported {len(titles)} songs to {output_file}")
         print("Songs exported:")
-        for song in songs_data:
-            print(f"  - {song['canonical_title_hawaiian']}")
+        for title in titles:
+            print(f"  - {title}")
         
     except Exception as e:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
         print(f"Error exporting data: {e}")
         raise
     finally:
-        cur.close()
         conn.close()
 
 if __name__ == '__main__':
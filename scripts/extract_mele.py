@@ -12,36 +12,74 @@ import re
 import json
 import os
 import sys
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
 from bs4 import BeautifulSoup
+from bs4.element import CData, NavigableString
 import html
 
+# Parse with libxml2 when lxml is installed; html.parser otherwise
+try:
+    import lxml  # noqa: F401
+    SOUP_FEATURES = 'lxml'
+except ImportError:
+    SOUP_FEATURES = 'html.parser'
 
+# Patterns are compiled once here rather than looked up per call
+_WS_RE = re.compile(r'[ \t]+')
+_NONALNUM_RE = re.compile(r'[^a-z0-9]+')
+
+# Folds vowel diacriticals to plain vowels and drops the ʻokina and backtick
+# for IDs. Curly quotes (‘ ’) are left to become '_' like other punctuation,
+# as they always have, so existing mele IDs stay the same
+_FOLD_TABLE = str.maketrans({
+    'ā': 'a', 'ă': 'a', 'â': 'a',
+    'ē': 'e', 'ĕ': 'e', 'ê': 'e',
+    'ī': 'i', 'ĭ': 'i', 'î': 'i',
+    'ō': 'o', 'ŏ': 'o', 'ô': 'o',
+    'ū': 'u', 'ŭ': 'u', 'û': 'u',
+    'ʻ': '', '`': '',
+})
+
+_COMPOSER_RES = [
+    re.compile(r'-\s*(?:by\s+|music by\s+|words & music by\s+)?([^-\n(]+?)(?:\s*$|\s*\n)', re.IGNORECASE),
+    re.compile(r'(?:by|music by|words & music by)\s+([^-\n(]+?)(?:\s*$|\s*\n)', re.IGNORECASE),
+]
+_SUBTITLE_RES = [
+    re.compile(r'\(([^)]+)\)'),  # Basic parentheses
+    re.compile(r':\s*([^-\n]+?)(?:\s*-|\s*$)'),  # After colon
+]
+
+_YOUTUBE_RE = re.compile(r'https?://(?:(?:www\.)?youtube\.com/watch\?v=[\w-]+|youtu\.be/[\w-]+)')
+
+# Each source pattern carries the source_info key it fills
+_SOURCE_RES = [
+    (re.compile(r'Source:\s*([^\n]+)', re.IGNORECASE), 'publication'),
+    (re.compile(r'Translated by\s+([^,\n]+)', re.IGNORECASE), 'translator'),
+    (re.compile(r'Hawaiian Text edited by\s+([^,\n©]+)', re.IGNORECASE), 'hawaiian_editor'),
+    (re.compile(r'©\s*(\d{4}[^,\n]*)', re.IGNORECASE), 'copyright'),
+    (re.compile(r'Copyright\s+([^,\n]+)', re.IGNORECASE), 'copyright'),
+]
+
+_HUI_RE = re.compile(r'hui:\s*', re.IGNORECASE)
+_CHORUS_RE = re.compile(r'chorus:\s*', re.IGNORECASE)
+
+
+# Titles, font texts and composer candidates repeat the same short strings
+@lru_cache(maxsize=8192)
 def clean_text(text):
     """Clean and normalize text content"""
     if not text:
         return ""
     
-    # Convert HTML entities to Unicode first
-    text = html.unescape(text)
-    
-    # Normalize diacriticals (basic conversion)
-    replacements = {
-        '&uuml;': 'ū',
-        '&auml;': 'ā', 
-        '&euml;': 'ē',
-        '&iuml;': 'ī',
-        '&ouml;': 'ō',
-        '&ucirc;': 'û',
-        '&acirc;': 'â'
-    }
-    
-    for old, new in replacements.items():
-        text = text.replace(old, new)
+    # Convert HTML entities to Unicode, composing kahakō with their vowels
+    text = unicodedata.normalize('NFC', html.unescape(text))
     
     # Remove excessive whitespace but preserve line breaks for now
-    text = re.sub(r'[ \t]+', ' ', text.strip())
+    text = _WS_RE.sub(' ', text.strip())
     
     return text
 
@@ -51,46 +89,30 @@ def clean_text_preserve_lines(text):
     if not text:
         return ""
     
-    text = html.unescape(text)
-    
-    # Normalize diacriticals
-    replacements = {
-        '&uuml;': 'ū', '&auml;': 'ā', '&euml;': 'ē',
-        '&iuml;': 'ī', '&ouml;': 'ō', '&ucirc;': 'û', '&acirc;': 'â'
-    }
-    
-    for old, new in replacements.items():
-        text = text.replace(old, new)
+    text = unicodedata.normalize('NFC', html.unescape(text))
     
-    # Split into lines and clean each line
-    lines = text.split('\n')
+    # Split into lines; str.split() trims each line and collapses its
+    # whitespace runs (including non-breaking spaces) to single spaces
     cleaned_lines = []
-    for line in lines:
-        line = re.sub(r'[ \t]+', ' ', line.strip())
-        if line:  # Only keep non-empty lines
-            cleaned_lines.append(line)
+    for line in text.split('\n'):
+        words = line.split()
+        if words:  # Only keep non-empty lines
+            cleaned_lines.append(' '.join(words))
     
     return cleaned_lines
 
 
+@lru_cache(maxsize=4096)
 def normalize_id(title):
     """Create normalized ID from title"""
     if not title:
         return "unknown"
     
     # Remove diacriticals for ID
-    id_text = title.lower()
-    id_text = re.sub(r'[ʻ''`]', '', id_text)  # Remove okina variants
-    id_text = re.sub(r'[āăâ]', 'a', id_text)
-    id_text = re.sub(r'[ēĕê]', 'e', id_text)
-    id_text = re.sub(r'[īĭî]', 'i', id_text)
-    id_text = re.sub(r'[ōŏô]', 'o', id_text)
-    id_text = re.sub(r'[ūŭû]', 'u', id_text)
-    
-    # Replace spaces and special chars with underscores
-    id_text = re.sub(r'[^a-z0-9]', '_', id_text)
-    id_text = re.sub(r'_+', '_', id_text)
-    id_text = id_text.strip('_')
+    id_text = title.lower().translate(_FOLD_TABLE)
+    
+    # Replace runs of spaces and special chars with a single underscore
+    id_text = _NONALNUM_RE.sub('_', id_text).strip('_')
     
     return id_text
 
@@ -112,19 +134,17 @@ def extract_title_and_subtitle(soup):
         if raw_title and not title_info['hawaiian']:
             title_info['hawaiian'] = raw_title
     
-    # Look for main title in center tags or large fonts
+    # Look for main title in center tags or large fonts. The header precedes
+    # the lyrics, so elements inside tables are not scanned.
     for elem in soup.find_all(['center', 'p', 'div']):
-        if not elem:
+        if elem.find_parent('table'):
             continue
-            
-        # Get all text content for this element
-        full_text = clean_text(elem.get_text())
         
-        # Check for title patterns in font tags
+        # Check for title patterns in font tags (or fonts wrapping a size 3 font)
         font_tags = elem.find_all('font')
         for font in font_tags:
             size = font.get('size', '')
-            if size in ['3', '+1', '4'] or 'size="3"' in str(font):
+            if size in ['3', '+1', '4'] or font.find('font', size='3'):
                 potential_title = clean_text(font.get_text())
                 
                 # Skip very short or very long potential titles
@@ -137,29 +157,29 @@ def extract_title_and_subtitle(soup):
                         if potential_title not in title_info['alternate_titles']:
                             title_info['alternate_titles'].append(potential_title)
         
-        # Look for composer patterns
-        composer_patterns = [
-            r'-\s*(?:by\s+|music by\s+|words & music by\s+)?([^-\n(]+?)(?:\s*$|\s*\n)',
-            r'(?:by|music by|words & music by)\s+([^-\n(]+?)(?:\s*$|\s*\n)',
-        ]
+        if title_info['composer'] and title_info['english']:
+            continue
         
-        for pattern in composer_patterns:
-            composer_match = re.search(pattern, full_text, re.IGNORECASE)
-            if composer_match and not title_info['composer']:
+        # Get all text content for this element
+        full_text = clean_text(elem.get_text())
+        
+        # Look for composer patterns
+        for pattern in _COMPOSER_RES:
+            if title_info['composer']:
+                break
+            composer_match = pattern.search(full_text)
+            if composer_match:
                 composer_candidate = clean_text(composer_match.group(1))
                 # Filter out obvious non-composer text
                 if composer_candidate and len(composer_candidate) < 50:
                     title_info['composer'] = composer_candidate
         
         # Look for English subtitle in parentheses
-        subtitle_patterns = [
-            r'\(([^)]+)\)',  # Basic parentheses
-            r':\s*([^-\n]+?)(?:\s*-|\s*$)',  # After colon
-        ]
-        
-        for pattern in subtitle_patterns:
-            subtitle_match = re.search(pattern, full_text)
-            if subtitle_match and not title_info['english']:
+        for pattern in _SUBTITLE_RES:
+            if title_info['english']:
+                break
+            subtitle_match = pattern.search(full_text)
+            if subtitle_match:
                 subtitle_candidate = clean_text(subtitle_match.group(1))
                 # Skip if it looks like a composer name or is too long
                 if (subtitle_candidate and 
@@ -171,27 +191,14 @@ def extract_title_and_subtitle(soup):
     return title_info
 
 
-def extract_youtube_links(soup):
-    """Extract YouTube links from the HTML"""
-    links = []
-    text = soup.get_text()
-    
-    # Look for YouTube URL patterns
-    youtube_patterns = [
-        r'https?://(?:www\.)?youtube\.com/watch\?v=[\w-]+',
-        r'https?://youtu\.be/[\w-]+',
-        r'http://www\.youtube\.com/watch\?v=[\w-]+'
-    ]
-    
-    for pattern in youtube_patterns:
-        matches = re.findall(pattern, text)
-        links.extend(matches)
-    
-    return list(set(links))  # Remove duplicates
+def extract_youtube_links(text):
+    """Extract YouTube links from the page text"""
+    # Look for YouTube URL patterns, dropping duplicates in first-seen order
+    return list(dict.fromkeys(_YOUTUBE_RE.findall(text)))
 
 
-def extract_source_info(soup):
-    """Extract source and attribution information"""
+def extract_source_info(text):
+    """Extract source and attribution information from the page text"""
     source_info = {
         'publication': '',
         'copyright': '',
@@ -201,34 +208,31 @@ def extract_source_info(soup):
         'additional_notes': ''
     }
     
-    # Look for source information usually at bottom
-    text = soup.get_text()
-    
-    # Find source patterns
-    source_patterns = [
-        r'Source:\s*([^\n]+)',
-        r'Translated by\s+([^,\n]+)',
-        r'Hawaiian Text edited by\s+([^,\n©]+)',
-        r'©\s*(\d{4}[^,\n]*)',
-        r'Copyright\s+([^,\n]+)'
-    ]
-    
-    for pattern in source_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    # Look for source patterns, usually at the bottom
+    for pattern, key in _SOURCE_RES:
+        match = pattern.search(text)
         if match:
-            found_text = clean_text(match.group(1))
-            if 'Translated by' in pattern:
-                source_info['translator'] = found_text
-            elif 'Hawaiian Text edited by' in pattern:
-                source_info['hawaiian_editor'] = found_text
-            elif 'Source:' in pattern:
-                source_info['publication'] = found_text
-            elif '©' in pattern or 'Copyright' in pattern:
-                source_info['copyright'] = found_text
+            source_info[key] = clean_text(match.group(1))
     
     return source_info
 
 
+def cell_text_with_breaks(cell):
+    """Get a cell's text with each <br> turned into a newline
+
+    Walks the already-parsed cell instead of serializing and re-parsing it;
+    like get_text(), only plain text and CDATA strings are kept.
+    """
+    parts = []
+    for node in cell.descendants:
+        if isinstance(node, NavigableString):
+            if type(node) in (NavigableString, CData):
+                parts.append(node)
+        elif node.name == 'br':
+            parts.append('\n')
+    return ''.join(parts)
+
+
 def extract_lyrics_and_translation(soup):
     """Extract lyrics and translations from table structure"""
     verses = []
@@ -245,36 +249,20 @@ def extract_lyrics_and_translation(soup):
                 hawaiian_cell = cells[0]
                 english_cell = cells[1]
                 
-                # Get raw HTML to preserve <br> tags for line breaks
-                hawaiian_html = str(hawaiian_cell)
-                english_html = str(english_cell)
-                
-                # Replace <br> tags with newlines
-                hawaiian_html = re.sub(r'<br[^>]*>', '\n', hawaiian_html, flags=re.IGNORECASE)
-                english_html = re.sub(r'<br[^>]*>', '\n', english_html, flags=re.IGNORECASE)
+                # Get text with <br> tags preserved as line breaks, then
+                # clean and split into lines
+                hawaiian_lines = clean_text_preserve_lines(cell_text_with_breaks(hawaiian_cell))
                 
-                # Parse back to get text with preserved line breaks
-                hawaiian_soup = BeautifulSoup(hawaiian_html, 'html.parser')
-                english_soup = BeautifulSoup(english_html, 'html.parser')
-                
-                hawaiian_text_raw = hawaiian_soup.get_text()
-                english_text_raw = english_soup.get_text()
+                # Skip header rows (titles, etc) before touching the English cell
+                if len(' '.join(hawaiian_lines)) < 10:
+                    continue
                 
-                # Clean and split into lines
-                hawaiian_lines = clean_text_preserve_lines(hawaiian_text_raw)
-                english_lines = clean_text_preserve_lines(english_text_raw)
+                english_lines = clean_text_preserve_lines(cell_text_with_breaks(english_cell))
                 
                 # Skip if too little content
                 if len(hawaiian_lines) < 2 and len(english_lines) < 2:
                     continue
                 
-                # Skip header rows (titles, etc)
-                hawaiian_joined = ' '.join(hawaiian_lines)
-                english_joined = ' '.join(english_lines)
-                
-                if len(hawaiian_joined) < 10:
-                    continue
-                
                 # Try to separate verses within this cell by looking for verse breaks
                 verse_sections = split_into_verses(hawaiian_lines, english_lines)
                 
@@ -290,17 +278,17 @@ def extract_lyrics_and_translation(soup):
                     label = ""
                     
                     first_line = h_lines[0] if h_lines else ""
-                    if re.search(r'hui:', first_line, re.IGNORECASE):
+                    if _HUI_RE.search(first_line):
                         verse_type = "hui"
                         label = "Hui:"
                         # Remove hui marker from first line
-                        h_lines[0] = re.sub(r'hui:\s*', '', h_lines[0], flags=re.IGNORECASE).strip()
+                        h_lines[0] = _HUI_RE.sub('', h_lines[0]).strip()
                         if not h_lines[0]:  # If line is now empty, remove it
                             h_lines = h_lines[1:]
-                    elif re.search(r'chorus:', first_line, re.IGNORECASE):
+                    elif _CHORUS_RE.search(first_line):
                         verse_type = "hui"
                         label = "Chorus:"
-                        h_lines[0] = re.sub(r'chorus:\s*', '', h_lines[0], flags=re.IGNORECASE).strip()
+                        h_lines[0] = _CHORUS_RE.sub('', h_lines[0]).strip()
                         if not h_lines[0]:
                             h_lines = h_lines[1:]
                     
@@ -308,8 +296,6 @@ def extract_lyrics_and_translation(soup):
                         verse = {
                             'order': len(verses) + 1,
                             'type': verse_type,
-                            'hawaiian_text': '\n'.join(h_lines),
-                            'english_text': '\n'.join(e_lines),
                             'hawaiian_lines': h_lines,
                             'english_lines': e_lines
                         }
@@ -329,14 +315,20 @@ def split_into_verses(hawaiian_lines, english_lines):
     current_e = []
     e_index = 0
     
-    for i, h_line in enumerate(hawaiian_lines):
-        # Look for verse break indicators
-        if (not h_line.strip() or 
-            re.match(r'^\s*$', h_line) or
-            (len(current_h) > 0 and 
-             (re.search(r'hui:|chorus:', h_line, re.IGNORECASE) or
-              # Look for verse number patterns
-              re.match(r'^\d+\.?\s*', h_line.strip())))):
+    for h_line in hawaiian_lines:
+        # Look for verse break indicators: a blank line, or a hui/chorus
+        # marker or verse number once the section has content
+        stripped = h_line.strip()
+        if not stripped:
+            is_break = True
+        elif current_h:
+            lowered = stripped.lower()
+            is_break = ('hui:' in lowered or 'chorus:' in lowered or
+                        stripped[0].isdecimal())
+        else:
+            is_break = False
+        
+        if is_break:
             
             # Save current section if it has content
             if current_h:
@@ -349,7 +341,7 @@ def split_into_verses(hawaiian_lines, english_lines):
                 e_index = 0
             
             # Don't skip the current line if it has content
-            if h_line.strip():
+            if stripped:
                 current_h.append(h_line)
                 if e_index < len(english_lines):
                     current_e.append(english_lines[e_index])
@@ -380,24 +372,29 @@ def split_into_verses(hawaiian_lines, english_lines):
 def extract_mele_data(file_path):
     """Main extraction function"""
     
-    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-        html_content = f.read()
+    # One read and one decode, skipping the buffered text-mode reader;
+    # line endings are translated as text mode would
+    html_content = Path(file_path).read_bytes().decode('utf-8', errors='ignore')
+    html_content = html_content.replace('\r\n', '\n').replace('\r', '\n')
     
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = BeautifulSoup(html_content, SOUP_FEATURES)
     
     # Extract all components
     title_info = extract_title_and_subtitle(soup)
-    youtube_links = extract_youtube_links(soup)
-    source_info = extract_source_info(soup)
+    doc_text = soup.get_text()
+    youtube_links = extract_youtube_links(doc_text)
+    source_info = extract_source_info(doc_text)
     verses = extract_lyrics_and_translation(soup)
     
+    mele_id = normalize_id(title_info['hawaiian'])
+    
     # Create structured output
     mele_data = {
-        'id': normalize_id(title_info['hawaiian']),
+        'id': mele_id,
         'title': {
             'hawaiian': title_info['hawaiian'],
             'english': title_info['english'],
-            'normalized': normalize_id(title_info['hawaiian']),
+            'normalized': mele_id,
             'alternate_titles': title_info['alternate_titles']
         },
         'attribution': {
@@ -436,6 +433,28 @@ def extract_mele_data(file_path):
     return mele_data
 
 
+def _process_one(file_path):
+    """Extract one file and encode its JSON in a worker process
+    
+    Returns (id, json_text, source_file, hawaiian_title, error) so one bad
+    file doesn't stop the batch. The parent writes the files, in input
+    order: ids can collide (titles that normalize alike, or 'unknown' for
+    untitled files), and workers writing the same path at once could
+    interleave two documents.
+    """
+    try:
+        mele_data = extract_mele_data(file_path)
+        
+        # With indent set, json.dump would hand the file hundreds of small
+        # chunks, so encode once here and write once in the parent
+        json_text = json.dumps(mele_data, indent=2, ensure_ascii=False)
+        
+        return (mele_data['id'], json_text, mele_data['metadata']['source_file'],
+                mele_data['title']['hawaiian'], None)
+    except Exception as e:
+        return None, None, None, None, str(e)
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python extract_mele.py [input_file_or_directory] [output_dir]")
@@ -460,31 +479,35 @@ def main():
     
     results = []
     
-    for file_path in files_to_process:
-        print(f"Processing: {file_path.name}")
-        
-        try:
-            mele_data = extract_mele_data(file_path)
+    # Files are independent, so extract them across worker processes
+    with ProcessPoolExecutor() as executor:
+        outcomes = executor.map(_process_one, files_to_process, chunksize=8)
+        for file_path, (mele_id, json_text, source_file, title, error) in zip(files_to_process, outcomes):
+            print(f"Processing: {file_path.name}")
             
-            # Write individual JSON file
-            output_file = output_dir / f"{mele_data['id']}.json"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(mele_data, f, indent=2, ensure_ascii=False)
+            if error is None:
+                # Write individual JSON file; a later file with the same id
+                # replaces an earlier one, as in a serial run
+                try:
+                    output_file = output_dir / f"{mele_id}.json"
+                    output_file.write_text(json_text, encoding='utf-8')
+                except Exception as e:
+                    error = str(e)
             
-            results.append(mele_data)
-            print(f"  -> Extracted: {mele_data['title']['hawaiian']}")
+            if error is not None:
+                print(f"  -> Error processing {file_path}: {error}")
+                continue
             
-        except Exception as e:
-            print(f"  -> Error processing {file_path}: {e}")
+            results.append(source_file)
+            print(f"  -> Extracted: {title}")
     
     # Write summary file
     summary_file = output_dir / 'extraction_summary.json'
-    with open(summary_file, 'w', encoding='utf-8') as f:
-        json.dump({
-            'total_files_processed': len(results),
-            'extraction_date': datetime.now().isoformat(),
-            'files': [r['metadata']['source_file'] for r in results]
-        }, f, indent=2, ensure_ascii=False)
+    summary_file.write_text(json.dumps({
+        'total_files_processed': len(results),
+        'extraction_date': datetime.now().isoformat(),
+        'files': results
+    }, indent=2, ensure_ascii=False), encoding='utf-8')
     
     print(f"\nExtraction complete! Processed {len(results)} files.")
     print(f"Output directory: {output_dir}")
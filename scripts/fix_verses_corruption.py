@@ -32,22 +32,22 @@ def detect_corrupted_format(verses_json_data):
     Detect if verses_json is in the corrupted format
     Returns: True if corrupted, False if correct
     """
+    # Correct format should be a dict with 'verses' key
+    if isinstance(verses_json_data, dict):
+        return 'verses' not in verses_json_data
+    
     if isinstance(verses_json_data, str):
         try:
             parsed = json.loads(verses_json_data)
         except json.JSONDecodeError:
             return True  # Invalid JSON is considered corrupted
-    elif isinstance(verses_json_data, (list, dict)):
-        parsed = verses_json_data
+    elif isinstance(verses_json_data, list):
+        return True  # A bare list of verses is the corrupted format
     else:
         return True  # Unknown type is corrupted
     
-    # Correct format should be a dict with 'verses' key
-    if isinstance(parsed, dict) and 'verses' in parsed:
-        return False  # This is the correct format
-    
-    # If it's a list or dict without 'verses', it's corrupted
-    return True
+    # A JSON string is correct only if it decodes to a dict with 'verses'
+    return not (isinstance(parsed, dict) and 'verses' in parsed)
 
 def fix_verses_format(verses_json_data):
     """
@@ -85,7 +85,8 @@ def fix_verses_format(verses_json_data):
 
 def main():
     """Main migration function"""
-    engine = create_engine(DB_URL)
+    # Batch executemany UPDATEs with execute_batch instead of one round-trip per row
+    engine = create_engine(DB_URL, executemany_mode='values_plus_batch')
     
     fixed_count = 0
     error_count = 0
@@ -96,24 +97,58 @@ def main():
     print("-" * 60)
     
     with engine.connect() as conn:
-        # Get all mele_sources records with verses_json
+        total_count = conn.execute(text("""
+        SELECT COUNT(*) FROM mele_sources WHERE verses_json IS NOT NULL
+        """)).scalar()
+        
+        print(f"Found {total_count} records with verses_json data")
+        
+        # The common corruption, a bare verses array, is wrapped in SQL
+        array_fixed = conn.execute(text("""
+        UPDATE mele_sources 
+        SET verses_json = jsonb_build_object('verses', verses_json::jsonb,
+                                             'processing_metadata', '{}'::jsonb),
+            updated_at = CURRENT_TIMESTAMP
+        WHERE jsonb_typeof(verses_json::jsonb) = 'array'
+        RETURNING canonical_mele_id
+        """)).scalars().all()
+        
+        print(f"Wrapped {len(array_fixed)} bare verses arrays in SQL")
+        for canonical_mele_id in sorted(array_fixed):
+            print(f"Fixing: {canonical_mele_id}")
+        
+        # Fetch the remaining records that are not an object with a 'verses' key.
+        # JSON strings are still checked in Python since they may wrap either form.
         query = text("""
         SELECT canonical_mele_id, verses_json 
         FROM mele_sources 
         WHERE verses_json IS NOT NULL
+          AND NOT (jsonb_typeof(verses_json::jsonb) = 'object'
+                   AND verses_json::jsonb ? 'verses')
         ORDER BY canonical_mele_id
         """)
         
         results = conn.execute(query).fetchall()
-        total_count = len(results)
         
-        print(f"Found {total_count} records with verses_json data")
+        print(f"{len(results)} other records need checking")
         print()
         
+        params = []
         for row in results:
             canonical_mele_id = row[0]
             verses_json_data = row[1]
             
+            # Decode JSON strings once here instead of in both helpers below.
+            # Invalid JSON, or a string wrapping another string, stays as-is
+            # so the helpers see exactly what they did before.
+            if isinstance(verses_json_data, str):
+                try:
+                    decoded = json.loads(verses_json_data)
+                except json.JSONDecodeError:
+                    decoded = verses_json_data
+                if not isinstance(decoded, str):
+                    verses_json_data = decoded
+            
             try:
                 # Check if this record needs fixing
                 if detect_corrupted_format(verses_json_data):
@@ -121,21 +156,10 @@ def main():
                     
                     # Fix the format
                     fixed_data = fix_verses_format(verses_json_data)
-                    
-                    # Update the database
-                    update_query = text("""
-                    UPDATE mele_sources 
-                    SET verses_json = :fixed_data,
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE canonical_mele_id = :song_id
-                    """)
-                    
-                    conn.execute(update_query, {
-                        "fixed_data": json.dumps(fixed_data, ensure_ascii=False),
+                    params.append({
+                        "fixed_data": json.dumps(fixed_data, ensure_ascii=False, separators=(',', ':')),
                         "song_id": canonical_mele_id
                     })
-                    
-                    fixed_count += 1
                 else:
                     print(f"Already correct: {canonical_mele_id}")
                     
@@ -143,8 +167,23 @@ def main():
                 print(f"ERROR fixing {canonical_mele_id}: {e}")
                 error_count += 1
         
-        # Commit all changes
-        conn.commit()
+        update_query = text("""
+        UPDATE mele_sources 
+        SET verses_json = :fixed_data,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE canonical_mele_id = :song_id
+        """)
+        
+        try:
+            # Update the database in one batch and commit all changes
+            if params:
+                conn.execute(update_query, params)
+            conn.commit()
+            fixed_count = len(array_fixed) + len(params)
+        except Exception as e:
+            conn.rollback()
+            print(f"ERROR updating {len(array_fixed) + len(params)} records: {e}")
+            error_count += len(array_fixed) + len(params)
     
     print()
     print("-" * 60)
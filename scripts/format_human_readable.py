@@ -10,81 +10,103 @@ Usage:
   python format_human_readable.py import [input_dir] [output_dir]
 """
 
+import io
 import json
 import os
 import sys
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+RULE = "=" * 80
+
+# Characters that matter when splitting a one-line list: a quote (unless
+# escaped with a backslash, which keeps it literal) or a comma
+_LIST_SPECIAL_RE = re.compile(r'\\"|[",]')
+
 
 def format_value(value, depth=0):
     """Format a value for human readable output"""
+    out = []
+    _format_value_into(value, out, depth)
+    return ''.join(out)
+
+def _format_value_into(value, out, depth):
+    """Append the formatted pieces of value to out
+    
+    Nested lists and dicts share one list all the way down, so a large
+    value is joined once at the top instead of re-copied at every level.
+    """
     indent = "  " * depth
     
     if value is None:
-        return "null"
+        out.append("null")
     elif isinstance(value, bool):
-        return str(value).lower()
+        out.append(str(value).lower())
     elif isinstance(value, str):
         if '\n' in value:
-            # Multi-line string - format with line breaks
-            lines = value.split('\n')
-            formatted_lines = [f"{indent}| {line}" for line in lines]
-            return '\n' + '\n'.join(formatted_lines)
+            # Multi-line string - format with line breaks, prefixing every
+            # line in one replace instead of splitting and rejoining
+            prefix = f"{indent}| "
+            out.append('\n' + prefix + value.replace('\n', '\n' + prefix))
         else:
-            return value
+            out.append(value)
     elif isinstance(value, list):
         if not value:
-            return "[]"
+            out.append("[]")
         elif all(isinstance(item, str) for item in value):
             # Simple string list
-            return f"[{', '.join(value)}]"
+            out.append(f"[{', '.join(value)}]")
         else:
             # Complex list - format each item
-            result = "[\n"
+            out.append("[\n")
             for i, item in enumerate(value):
-                result += f"{indent}  [{i}] {format_value(item, depth + 1)}\n"
-            result += f"{indent}]"
-            return result
+                out.append(f"{indent}  [{i}] ")
+                _format_value_into(item, out, depth + 1)
+                out.append("\n")
+            out.append(f"{indent}]")
     elif isinstance(value, dict):
         if not value:
-            return "{}"
-        result = "{\n"
-        for key, val in value.items():
-            result += f"{indent}  {key}: {format_value(val, depth + 1)}\n"
-        result += f"{indent}}}"
-        return result
+            out.append("{}")
+        else:
+            out.append("{\n")
+            for key, val in value.items():
+                out.append(f"{indent}  {key}: ")
+                _format_value_into(val, out, depth + 1)
+                out.append("\n")
+            out.append(f"{indent}}}")
     else:
-        return str(value)
+        out.append(str(value))
 
 def format_mele_to_text(mele_data):
     """Convert JSON mele data to complete human-readable text format"""
     
-    lines = []
+    # Write straight into one buffer rather than collecting lines to join
+    buf = io.StringIO()
+    write = buf.write
     
     # Header
-    lines.append("=" * 80)
-    lines.append("MELE DATA - EDITABLE FORMAT")
-    lines.append("=" * 80)
-    lines.append("")
-    lines.append("# All JSON fields are preserved below for editing")
-    lines.append("# Format: FIELD_NAME: value")
-    lines.append("# Nested structures use indentation")
-    lines.append("# Multi-line text uses | prefix")
-    lines.append("")
+    write(f"{RULE}\n")
+    write("MELE DATA - EDITABLE FORMAT\n")
+    write(f"{RULE}\n")
+    write("\n")
+    write("# All JSON fields are preserved below for editing\n")
+    write("# Format: FIELD_NAME: value\n")
+    write("# Nested structures use indentation\n")
+    write("# Multi-line text uses | prefix\n")
+    write("\n")
     
     # Process all top-level fields
     for key, value in mele_data.items():
-        lines.append(f"[{key.upper()}]")
-        formatted_value = format_value(value)
-        lines.append(formatted_value)
-        lines.append("")
+        write(f"[{key.upper()}]\n")
+        write(format_value(value))
+        write("\n\n")
     
-    lines.append("=" * 80)
-    lines.append("END OF MELE DATA")
-    lines.append("=" * 80)
+    write(f"{RULE}\n")
+    write("END OF MELE DATA\n")
+    write(RULE)
     
-    return '\n'.join(lines)
+    return buf.getvalue()
 
 
 def parse_value(text, depth=0):
@@ -106,20 +128,33 @@ def parse_value(text, depth=0):
         content = text[1:-1].strip()
         if not content:
             return []
-        # Split by comma but handle quoted strings
+        if '"' not in content:
+            # format_value writes lists unquoted, so usually every comma splits
+            items = [item.strip() for item in content.split(',')]
+            if not items[-1]:
+                items.pop()
+            return items
+        # Split by comma but handle quoted strings, jumping between the
+        # quotes and commas instead of walking every character
         items = []
-        current_item = ""
+        current_item = []
         in_quotes = False
-        for char in content:
-            if char == '"' and (not current_item or current_item[-1] != '\\'):
+        pos = 0
+        for match in _LIST_SPECIAL_RE.finditer(content):
+            token = match.group()
+            if token == '"':
+                current_item.append(content[pos:match.start()])
+                pos = match.end()
                 in_quotes = not in_quotes
-            elif char == ',' and not in_quotes:
-                items.append(current_item.strip())
-                current_item = ""
-            else:
-                current_item += char
-        if current_item.strip():
-            items.append(current_item.strip())
+            elif token == ',' and not in_quotes:
+                current_item.append(content[pos:match.start()])
+                items.append(''.join(current_item).strip())
+                current_item = []
+                pos = match.end()
+        current_item.append(content[pos:])
+        last_item = ''.join(current_item).strip()
+        if last_item:
+            items.append(last_item)
         return items
     elif text.startswith('[\n') and text.endswith('\n]'):
         # Complex list with nested structures
@@ -208,15 +243,20 @@ def parse_value(text, depth=0):
             return text
 
 
-def parse_text_to_mele(text_content):
-    """Parse human-readable text back to JSON mele data"""
+def parse_text_to_mele(lines):
+    """Parse human-readable text back to JSON mele data
+    
+    Takes any iterable of lines, such as an open text file, so the whole
+    file never has to be held and split in memory at once.
+    """
     
-    lines = text_content.split('\n')
     mele_data = {}
     current_field = None
     current_content = []
     
     for line in lines:
+        line = line.rstrip('\n')
+        
         # Skip header/footer and comments
         if (line.startswith('=') or 
             line.startswith('#') or 
@@ -248,38 +288,64 @@ def parse_text_to_mele(text_content):
     return mele_data
 
 
+def _export_one(args):
+    """Format one JSON file and write its text in a worker process
+    
+    Returns (output_name, hawaiian_title, error) so one bad file doesn't
+    stop the batch and only a few strings are pickled back.
+    """
+    json_file, output_path = args
+    try:
+        # Read the raw bytes in one call; json.loads decodes UTF-8 itself
+        mele_data = json.loads(json_file.read_bytes())
+        
+        formatted_text = format_mele_to_text(mele_data)
+        
+        base_name = json_file.stem
+        output_file = output_path / f"{base_name}.txt"
+        
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(formatted_text)
+        
+        title = mele_data.get('title', {}).get('hawaiian', 'Unknown')
+        return output_file.name, title, None
+    except Exception as e:
+        return None, None, str(e)
+
+
 def export_to_text(input_dir, output_dir):
     """Export JSON files to human-readable text"""
     input_path = Path(input_dir)
     output_path = Path(output_dir)
+    
+    if not input_path.is_dir():
+        print(f"Input directory not found: {input_path}")
+        return
+    
     output_path.mkdir(exist_ok=True)
     
-    json_files = list(input_path.glob('*.json'))
-    mele_files = [f for f in json_files if 'summary' not in f.name.lower()]
+    # One lazy scandir pass that filters names as it goes, skipping the
+    # intermediate list of every JSON file
+    with os.scandir(input_path) as entries:
+        mele_files = [Path(entry.path) for entry in entries
+                      if entry.name.endswith('.json') and 'summary' not in entry.name.lower()]
     
     processed_count = 0
     
-    for json_file in mele_files:
-        print(f"Exporting: {json_file.name}")
-        
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                mele_data = json.load(f)
-            
-            formatted_text = format_mele_to_text(mele_data)
-            
-            base_name = json_file.stem
-            output_file = output_path / f"{base_name}.txt"
+    # Each file is formatted independently, so spread them over processes
+    with ProcessPoolExecutor() as executor:
+        outcomes = executor.map(_export_one,
+                                [(json_file, output_path) for json_file in mele_files],
+                                chunksize=8)
+        for json_file, (output_name, title, error) in zip(mele_files, outcomes):
+            print(f"Exporting: {json_file.name}")
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(formatted_text)
+            if error is not None:
+                print(f"  -> Error exporting {json_file}: {error}")
+                continue
             
             processed_count += 1
-            title = mele_data.get('title', {}).get('hawaiian', 'Unknown')
-            print(f"  -> Created: {output_file.name} ({title})")
-            
-        except Exception as e:
-            print(f"  -> Error exporting {json_file}: {e}")
+            print(f"  -> Created: {output_name} ({title})")
     
     print(f"\nExport complete! Processed {processed_count} files.")
     print(f"Output directory: {output_path}")
@@ -289,9 +355,15 @@ def import_from_text(input_dir, output_dir):
     """Import human-readable text files back to JSON"""
     input_path = Path(input_dir)
     output_path = Path(output_dir)
+    
+    if not input_path.is_dir():
+        print(f"Input directory not found: {input_path}")
+        return
+    
     output_path.mkdir(exist_ok=True)
     
-    text_files = list(input_path.glob('*.txt'))
+    with os.scandir(input_path) as entries:
+        text_files = [Path(entry.path) for entry in entries if entry.name.endswith('.txt')]
     
     processed_count = 0
     
@@ -299,16 +371,17 @@ def import_from_text(input_dir, output_dir):
         print(f"Importing: {text_file.name}")
         
         try:
+            # Hand the file over line by line instead of reading and splitting it
             with open(text_file, 'r', encoding='utf-8') as f:
-                text_content = f.read()
-            
-            mele_data = parse_text_to_mele(text_content)
+                mele_data = parse_text_to_mele(f)
             
             base_name = text_file.stem
             output_file = output_path / f"{base_name}.json"
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(mele_data, f, indent=2, ensure_ascii=False)
+            # With indent set, json.dump would hand the file hundreds of
+            # small chunks, so encode once and write once
+            output_file.write_text(json.dumps(mele_data, indent=2, ensure_ascii=False),
+                                   encoding='utf-8')
             
             processed_count += 1
             title = mele_data.get('title', {}).get('hawaiian', 'Unknown')
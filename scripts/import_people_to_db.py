@@ -5,8 +5,12 @@ Import people JSON data into the PostgreSQL database
 import json
 import os
 import psycopg2
+from psycopg2.extras import execute_values
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
+from operator import itemgetter
 import re
 
 def get_db_config():
@@ -19,34 +23,150 @@ def get_db_config():
         'sslmode': 'require'
     }
 
-def parse_date(date_str):
-    """Parse various date formats and return PostgreSQL-compatible date string or None"""
-    if not date_str or date_str == "null":
-        return None
-    
+# A bare year like "1987", and the ISO form most stored dates already use
+_YEAR_RE = re.compile(r'^\d{4}$')
+_ISO_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$', re.ASCII)
+
+# Only formats whose separator appears in the string can match it, so try
+# just those rather than letting every other format raise first
+_SLASH_FORMATS = (
+    "%m/%d/%Y",   # "08/12/1892"
+    "%d/%m/%Y",   # "12/08/1892"
+)
+_DASH_FORMATS = (
+    "%Y-%m-%d",   # "1892-08-12"
+)
+_NAMED_FORMATS = (
+    "%B %d, %Y",  # "August 12, 1892"
+)
+
+@lru_cache(maxsize=2048)
+def _parse_date_text(date_text):
+    """Parse one date string, caching results since many people share dates"""
     # If it's just a year like "1987"
-    if re.match(r'^\d{4}$', str(date_str)):
-        return f"{date_str}-01-01"
+    if _YEAR_RE.match(date_text):
+        return f"{date_text}-01-01"
     
-    # Try to parse common date formats
-    date_formats = [
-        "%B %d, %Y",  # "August 12, 1892"
-        "%Y-%m-%d",   # "1892-08-12"
-        "%m/%d/%Y",   # "08/12/1892"
-        "%d/%m/%Y",   # "12/08/1892"
-    ]
+    # Already ISO: fromisoformat checks the date is real without strptime
+    if _ISO_RE.match(date_text):
+        try:
+            date.fromisoformat(date_text)
+            return date_text
+        except ValueError:
+            pass
+    
+    if '/' in date_text:
+        date_formats = _SLASH_FORMATS
+    elif '-' in date_text:
+        date_formats = _DASH_FORMATS
+    else:
+        date_formats = _NAMED_FORMATS
     
     for fmt in date_formats:
         try:
-            parsed_date = datetime.strptime(str(date_str), fmt)
+            parsed_date = datetime.strptime(date_text, fmt)
             return parsed_date.strftime("%Y-%m-%d")
         except ValueError:
             continue
     
-    # If we can't parse it, return None
-    print(f"   ⚠️  Could not parse date: {date_str}")
     return None
 
+def parse_date(date_str):
+    """Parse various date formats and return PostgreSQL-compatible date string or None"""
+    if not date_str or date_str == "null":
+        return None
+    
+    parsed_date = _parse_date_text(str(date_str))
+    
+    # If we can't parse it, return None
+    if parsed_date is None:
+        print(f"   ⚠️  Could not parse date: {date_str}")
+    return parsed_date
+
+# Column order of the upsert, with the value used when a file leaves a field
+# out; person_id and full_name have no default, so a file missing them fails
+PERSON_COLUMNS = (
+    'person_id', 'full_name', 'display_name',
+    'place_of_birth', 'places_of_hawaiian_influence', 'primary_influence_location',
+    'hawaiian_speaker', 'birth_date', 'death_date', 'cultural_background',
+    'biographical_notes', 'roles', 'primary_role', 'specialties',
+    'active_period_start', 'active_period_end', 'notable_works', 'awards_honors',
+    'composition_count', 'translation_count', 'editing_count', 'performance_count',
+    'total_contributions', 'most_frequent_role', 'last_activity_date',
+    'source_references', 'verification_status', 'last_verified_date',
+)
+PERSON_DEFAULTS = dict.fromkeys(PERSON_COLUMNS[2:])
+PERSON_DEFAULTS.update({
+    'places_of_hawaiian_influence': [],
+    'roles': [],
+    'specialties': [],
+    'notable_works': [],
+    'awards_honors': [],
+    'composition_count': 0,
+    'translation_count': 0,
+    'editing_count': 0,
+    'performance_count': 0,
+    'total_contributions': 0,
+    'source_references': {},
+    'verification_status': 'unverified',
+})
+_get_person_columns = itemgetter(*PERSON_COLUMNS)
+
+# One upsert for every person; execute_values expands VALUES %s per page of rows
+UPSERT_PEOPLE_SQL = """
+    INSERT INTO people (
+        person_id, full_name, display_name,
+        place_of_birth, places_of_hawaiian_influence, primary_influence_location,
+        hawaiian_speaker, birth_date, death_date, cultural_background,
+        biographical_notes, roles, primary_role, specialties,
+        active_period_start, active_period_end, notable_works, awards_honors,
+        composition_count, translation_count, editing_count, performance_count,
+        total_contributions, most_frequent_role, last_activity_date,
+        source_references, verification_status, last_verified_date
+    ) VALUES %s
+    ON CONFLICT (person_id) DO UPDATE SET
+        full_name = EXCLUDED.full_name,
+        display_name = EXCLUDED.display_name,
+        place_of_birth = EXCLUDED.place_of_birth,
+        places_of_hawaiian_influence = EXCLUDED.places_of_hawaiian_influence,
+        primary_influence_location = EXCLUDED.primary_influence_location,
+        hawaiian_speaker = EXCLUDED.hawaiian_speaker,
+        birth_date = EXCLUDED.birth_date,
+        death_date = EXCLUDED.death_date,
+        cultural_background = EXCLUDED.cultural_background,
+        biographical_notes = EXCLUDED.biographical_notes,
+        roles = EXCLUDED.roles,
+        primary_role = EXCLUDED.primary_role,
+        specialties = EXCLUDED.specialties,
+        active_period_start = EXCLUDED.active_period_start,
+        active_period_end = EXCLUDED.active_period_end,
+        notable_works = EXCLUDED.notable_works,
+        awards_honors = EXCLUDED.awards_honors,
+        source_references = EXCLUDED.source_references,
+        verification_status = EXCLUDED.verification_status,
+        last_verified_date = EXCLUDED.last_verified_date,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+# The same upsert as a server-side prepared statement for one row at a time;
+# Postgres takes each parameter's type from its target column
+PREPARE_UPSERT_PERSON_SQL = "PREPARE upsert_person AS" + UPSERT_PEOPLE_SQL.replace(
+    "VALUES %s",
+    "VALUES (" + ", ".join(f"${i}" for i in range(1, len(PERSON_COLUMNS) + 1)) + ")")
+EXECUTE_UPSERT_PERSON_SQL = "EXECUTE upsert_person (" + ", ".join(["%s"] * len(PERSON_COLUMNS)) + ")"
+
+def person_row(person_data):
+    """Build the people table row for one person's JSON data"""
+    # Fill in the defaults and pull all 28 columns out in one call
+    row = list(_get_person_columns({**PERSON_DEFAULTS, **person_data}))
+    
+    row[4] = json.dumps(row[4])    # places_of_hawaiian_influence
+    row[7] = parse_date(row[7])    # birth_date
+    row[8] = parse_date(row[8])    # death_date
+    row[25] = json.dumps(row[25])  # source_references
+    row[27] = parse_date(row[27])  # last_verified_date
+    return tuple(row)
+
 def import_people_to_db():
     """Import all people JSON files into the database"""
     config = get_db_config()
@@ -64,91 +184,56 @@ def import_people_to_db():
     imported_count = 0
     error_count = 0
     
-    for json_file in json_files:
-        try:
-            with conn.cursor() as cursor:
+    # Read every file first so the rows can go to the database in one batch.
+    # The reads are queued on a few threads up front, so later files are
+    # loading while earlier ones are parsed; parsing stays on this thread
+    # so progress and date warnings print in file order.
+    rows = []
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        pending = [(json_file, executor.submit(json_file.read_bytes)) for json_file in json_files]
+        for json_file, raw in pending:
+            try:
                 print(f"📥 Processing {json_file.name}...")
                 
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    person_data = json.load(f)
-                    
-                    # Insert into people table
-                    cursor.execute("""
-                        INSERT INTO people (
-                            person_id, full_name, display_name,
-                            place_of_birth, places_of_hawaiian_influence, primary_influence_location,
-                            hawaiian_speaker, birth_date, death_date, cultural_background,
-                            biographical_notes, roles, primary_role, specialties,
-                            active_period_start, active_period_end, notable_works, awards_honors,
-                            composition_count, translation_count, editing_count, performance_count,
-                            total_contributions, most_frequent_role, last_activity_date,
-                            source_references, verification_status, last_verified_date
-                        ) VALUES (
-                            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                        )
-                        ON CONFLICT (person_id) DO UPDATE SET
-                            full_name = EXCLUDED.full_name,
-                            display_name = EXCLUDED.display_name,
-                            place_of_birth = EXCLUDED.place_of_birth,
-                            places_of_hawaiian_influence = EXCLUDED.places_of_hawaiian_influence,
-                            primary_influence_location = EXCLUDED.primary_influence_location,
-                            hawaiian_speaker = EXCLUDED.hawaiian_speaker,
-                            birth_date = EXCLUDED.birth_date,
-                            death_date = EXCLUDED.death_date,
-                            cultural_background = EXCLUDED.cultural_background,
-                            biographical_notes = EXCLUDED.biographical_notes,
-                            roles = EXCLUDED.roles,
-                            primary_role = EXCLUDED.primary_role,
-                            specialties = EXCLUDED.specialties,
-                            active_period_start = EXCLUDED.active_period_start,
-                            active_period_end = EXCLUDED.active_period_end,
-                            notable_works = EXCLUDED.notable_works,
-                            awards_honors = EXCLUDED.awards_honors,
-                            source_references = EXCLUDED.source_references,
-                            verification_status = EXCLUDED.verification_status,
-                            last_verified_date = EXCLUDED.last_verified_date,
-                            updated_at = CURRENT_TIMESTAMP
-                    """, (
-                        person_data['person_id'],
-                        person_data['full_name'],
-                        person_data.get('display_name'),
-                        person_data.get('place_of_birth'),
-                        json.dumps(person_data.get('places_of_hawaiian_influence', [])),
-                        person_data.get('primary_influence_location'),
-                        person_data.get('hawaiian_speaker'),
-                        parse_date(person_data.get('birth_date')),
-                        parse_date(person_data.get('death_date')),
-                        person_data.get('cultural_background'),
-                        person_data.get('biographical_notes'),
-                        person_data.get('roles', []),
-                        person_data.get('primary_role'),
-                        person_data.get('specialties', []),
-                        person_data.get('active_period_start'),
-                        person_data.get('active_period_end'),
-                        person_data.get('notable_works', []),
-                        person_data.get('awards_honors', []),
-                        person_data.get('composition_count', 0),
-                        person_data.get('translation_count', 0),
-                        person_data.get('editing_count', 0),
-                        person_data.get('performance_count', 0),
-                        person_data.get('total_contributions', 0),
-                        person_data.get('most_frequent_role'),
-                        person_data.get('last_activity_date'),
-                        json.dumps(person_data.get('source_references', {})),
-                        person_data.get('verification_status', 'unverified'),
-                        parse_date(person_data.get('last_verified_date'))
-                    ))
+                # Raw bytes from one read call; json.loads decodes UTF-8 itself
+                person_data = json.loads(raw.result())
+                rows.append((json_file, person_data['full_name'], person_row(person_data)))
+                
+            except Exception as e:
+                error_count += 1
+                print(f"   ❌ Error importing {json_file.name}: {e}")
+    
+    try:
+        with conn.cursor() as cursor:
+            execute_values(cursor, UPSERT_PEOPLE_SQL, [row for _, _, row in rows], page_size=200)
+        conn.commit()
+        imported_count += len(rows)
+        for _, full_name, _ in rows:
+            print(f"   ✅ Successfully imported {full_name}")
+    except Exception as e:
+        conn.rollback()
+        print(f"   ⚠️  Batch import failed ({e}); retrying one person at a time")
+        
+        # Parse and plan the upsert once for all the single-row retries;
+        # a prepared statement outlives the rollbacks below
+        with conn.cursor() as cursor:
+            cursor.execute(PREPARE_UPSERT_PERSON_SQL)
+        conn.commit()
+        
+        for json_file, full_name, row in rows:
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute(EXECUTE_UPSERT_PERSON_SQL, row)
                 
                 # Commit this person's data
                 conn.commit()
                 imported_count += 1
-                print(f"   ✅ Successfully imported {person_data['full_name']}")
+                print(f"   ✅ Successfully imported {full_name}")
                 
-        except Exception as e:
-            error_count += 1
-            print(f"   ❌ Error importing {json_file.name}: {e}")
-            conn.rollback()  # Rollback just this person's transaction
+            except Exception as e:
+                error_count += 1
+                print(f"   ❌ Error importing {json_file.name}: {e}")
+                conn.rollback()  # Rollback just this person's transaction
     
     try:
         with conn.cursor() as cursor:
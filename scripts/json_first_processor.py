@@ -447,19 +447,17 @@ class JSONFirstProcessor:
         if not verses:
             return "unknown"
             
-        # Count verses and choruses
-        verse_count = len([v for v in verses if v.get('type') == 'verse'])
-        chorus_count = len([v for v in verses if v.get('type') == 'chorus'])
-        
-        # Analyze verse line patterns
+        # One pass: note whether there is a chorus and collect the line
+        # count of each verse
         verse_line_counts = []
-        has_hui = chorus_count > 0
+        has_hui = False
         
         for verse in verses:
-            if verse.get('type') == 'verse':
-                lines = verse.get('lines', [])
-                line_count = len(lines)
-                verse_line_counts.append(line_count)
+            verse_type = verse.get('type')
+            if verse_type == 'verse':
+                verse_line_counts.append(len(verse.get('lines', [])))
+            elif verse_type == 'chorus':
+                has_hui = True
         
         # Determine structure based on patterns
         if has_hui:
@@ -112,8 +112,9 @@ def process_json_file(file_path):
     youtube_urls = []
     verses = data.get('content', {}).get('verses', [])
     for verse in verses:
-        hawaiian_text = verse.get('hawaiian_text', '')
-        english_text = verse.get('english_text', '')
+        # extract_mele stores only the line lists; older files also carry the joined text
+        hawaiian_text = verse.get('hawaiian_text') or '\n'.join(verse.get('hawaiian_lines', []))
+        english_text = verse.get('english_text') or '\n'.join(verse.get('english_lines', []))
         
         # Extract URLs
         urls_h = extract_youtube_urls(hawaiian_text)
@@ -129,14 +130,16 @@ def process_json_file(file_path):
     youtube_urls.extend(existing_urls)
     youtube_urls = list(set(youtube_urls))  # Remove duplicates
     
+    attribution = data.get('attribution', {})
+    
     return {
         'source_data': data,
         'youtube_urls': youtube_urls,
         'canonical_id': None,  # To be set during canonical creation
         'needs_review': {
-            'missing_composer': not data.get('attribution', {}).get('composer'),
-            'multiple_translators': bool(data.get('attribution', {}).get('translator') and 
-                                       data.get('attribution', {}).get('hawaiian_editor')),
+            'missing_composer': not attribution.get('composer'),
+            'multiple_translators': bool(attribution.get('translator') and
+                                         attribution.get('hawaiian_editor')),
             'title_needs_verification': len(data.get('title', {}).get('hawaiian', '')) < 3
         }
     }
@@ -151,16 +154,23 @@ def create_canonical_entries(processed_files, output_dir):
         title_info = data.get('title', {})
         attribution = data.get('attribution', {})
         
+        # Look each field up once; several are used in both entries below
+        hawaiian_title = title_info.get('hawaiian', '')
+        english_title = title_info.get('english', '')
+        composer = attribution.get('composer', '')
+        translator = attribution.get('translator', '')
+        hawaiian_editor = attribution.get('hawaiian_editor', '')
+        
         # Create canonical ID
-        canonical_id = f"{normalize_id(title_info.get('hawaiian', ''))}_canonical"
+        canonical_id = f"{normalize_id(hawaiian_title)}_canonical"
         file_data['canonical_id'] = canonical_id
         
         # Create canonical entry
         canonical_entry = {
             'canonical_mele_id': canonical_id,
-            'canonical_title_hawaiian': title_info.get('hawaiian', ''),
-            'canonical_title_english': title_info.get('english', ''),
-            'primary_composer': attribution.get('composer', ''),
+            'canonical_title_hawaiian': hawaiian_title,
+            'canonical_title_english': english_title,
+            'primary_composer': composer,
             'primary_lyricist': attribution.get('lyricist', ''),
             'estimated_composition_date': '',  # Manual entry needed
             'cultural_significance_notes': '',  # Manual entry needed
@@ -173,14 +183,14 @@ def create_canonical_entries(processed_files, output_dir):
         # Add to review data
         review_data.append({
             'canonical_id': canonical_id,
-            'hawaiian_title': title_info.get('hawaiian', ''),
-            'english_title': title_info.get('english', ''),
-            'composer': attribution.get('composer', ''),
-            'translator': attribution.get('translator', ''),
-            'hawaiian_editor': attribution.get('hawaiian_editor', ''),
+            'hawaiian_title': hawaiian_title,
+            'english_title': english_title,
+            'composer': composer,
+            'translator': translator,
+            'hawaiian_editor': hawaiian_editor,
             'source_file': data.get('metadata', {}).get('source_file', ''),
-            'needs_composer_research': not attribution.get('composer'),
-            'has_multiple_editors': bool(attribution.get('translator') and attribution.get('hawaiian_editor')),
+            'needs_composer_research': not composer,
+            'has_multiple_editors': bool(translator and hawaiian_editor),
             'youtube_url_count': len(file_data['youtube_urls'])
         })
     
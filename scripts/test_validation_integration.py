@@ -62,6 +62,7 @@ def test_validation_session():
     try:
         connection_string = get_connection_string()
         db_validator = DatabaseValidator(connection_string)
+        db_validator.connect()
         
         # Start a test session
         session_id = db_validator.start_validation_session("test_integration_session")
@@ -106,6 +107,7 @@ def test_song_validation():
         # Test database storage
         connection_string = get_connection_string()
         db_validator = DatabaseValidator(connection_string)
+        db_validator.connect()
         session_id = db_validator.start_validation_session("test_song_validation")
         
         # For testing, we'll use an actual canonical_mele_id from the database
@@ -113,6 +115,7 @@ def test_song_validation():
         
         validation_data = parser._prepare_validation_data(parsed_song)
         db_validator.validate_and_store_song(validation_data, test_canonical_mele_id)
+        db_validator.flush_pending()
         print("✅ Stored validation results in database")
         
         # Retrieve the stored data (simplified check)